@@ -1,88 +1,438 @@
-from typing import Optional
+from itertools import count
+from sys import intern
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 from decaf_config import CODEGEN_DEBUG
-from decaf_util import Counter, NestedStrList
+from decaf_util import Counter
+
+
+# every name ever generated for a prefix, indexed by its number
+# generators with the same prefix share a pool, so each name is only formatted once
+# the common ranges are generated up front so typical programs never format a name
+# names are interned so that later dict lookups keyed by register names compare by identity
+_NAME_POOLS: Dict[str, List[str]] = {
+    "t": [intern(f"t{i}") for i in range(8192)],
+    "a": [intern(f"a{i}") for i in range(256)],
+    "L": [intern(f"L{i}") for i in range(8192)],
+}
 
 
 class RegisterGenerator(Counter):
+    __slots__ = ("prefix", "pool")
+
     def __init__(self, prefix: str):
         super().__init__(0)
         self.prefix = prefix
+        self.pool = _NAME_POOLS.setdefault(prefix, [])
 
     def next(self) -> str:
-        i = super().next()
-        return f"{self.prefix}{i}"
+        i = self.curr
+        self.curr = i + 1
+
+        pool = self.pool
+        if i < len(pool):
+            return pool[i]
+
+        # the pool is filled in order, so every missing name up to i is added
+        prefix = self.prefix
+        pool.extend(intern(f"{prefix}{j}") for j in range(len(pool), i + 1))
+        return pool[i]
+
+    def next_many(self, n: int) -> List[str]:
+        """
+        Generates the next n names in one go.
+        """
+        i = self.curr
+        end = i + n
+        self.curr = end
+
+        pool = self.pool
+        if end > len(pool):
+            prefix = self.prefix
+            pool.extend(intern(f"{prefix}{j}") for j in range(len(pool), end))
+        return pool[i:end]
 
 
 class ArgumentRegisterGenerator(RegisterGenerator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("a")
 
 
 class TemporaryRegisterGenerator(RegisterGenerator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("t")
 
 
-class LabelGenerator:
-    gen = RegisterGenerator("L")
+_temp_gen = TemporaryRegisterGenerator()
 
-    @staticmethod
-    def next() -> str:
-        """
-        Generates an unique label that has not been used in the program yet
-        """
-        return LabelGenerator.gen.next()
+# labels only ever count upwards, so a C-level counter is enough to track them
+_label_counter = count().__next__
+_LABELS = _NAME_POOLS["L"]
+
+
+def next_label() -> str:
+    """
+    Generates an unique label that has not been used in the program yet
+    """
+    i = _label_counter()
+    return _LABELS[i] if i < len(_LABELS) else intern(f"L{i}")
+
+# Generates a new temporary register that has not been used.
+# NOTE: The generated register may be used by other parts of the program.
+#   It is up to the programmer to ensure that the generator is only reset for specific purposes.
+next_tmp = _temp_gen.next
+
+# Same as `next_tmp`, but generates several temporary registers at once.
+next_tmps = _temp_gen.next_many
+
+
+def reset_tmp(new_start: Optional[int] = None):
+    """
+    Resets the temporary generator so that the next temporary register is t0 (or t<new_start>).
+    Shared constants held in registers that may now be reused are forgotten.
+    """
+    _temp_gen.reset(new_start)
+    if new_start == None:
+        _const_pool.clear()
+    else:
+        for key in [k for k, (_, i) in _const_pool.items() if i >= new_start]:
+            del _const_pool[key]
+
+
+def cur_tmp() -> int:
+    """
+    Returns the number of the next temporary register that will be generated.
+    """
+    return _temp_gen.curr
+
+
+# (move_immed instruction, value) => (register, register number) for constants already loaded in the current procedure
+# NOTE: a constant is loaded the first time it is needed, so it is only safe to reuse where that load is guaranteed to have run
+#   code that may be skipped (branches, loop bodies) must restore the pool afterwards with `save_consts` / `restore_consts`
+_const_pool: Dict[Tuple[str, Union[int, float]], Tuple[str, int]] = {}
+
+
+def const_tmp(sink: "CodeSink", op: str, value: Union[int, float]) -> str:
+    """
+    Returns a temporary register holding `value`, loading it with `op` (move_immed_i / move_immed_f) only if needed.
+    The register is shared, so it must only ever be read from.
+    """
+    key = (op, value)
+    if key in _const_pool:
+        return _const_pool[key][0]
+
+    i = _temp_gen.curr
+    out_t = next_tmp()
+    sink.emit(f"{op} {out_t}, {value}")
+    if EMIT_COMMENTS:
+        emit_comment(sink, f"{out_t} = {value}")
+    _const_pool[key] = (out_t, i)
+    return out_t
+
+
+def save_consts() -> Dict[Tuple[str, Union[int, float]], Tuple[str, int]]:
+    """
+    Takes a snapshot of the shared constants before generating code that may not run.
+    """
+    return dict(_const_pool)
+
+
+def restore_consts(saved: Dict[Tuple[str, Union[int, float]], Tuple[str, int]]):
+    """
+    Forgets every shared constant loaded since `save_consts`.
+    """
+    _const_pool.clear()
+    _const_pool.update(saved)
+
+
+def emit_moves(sink: "CodeSink", moves: List[Tuple[str, str]]):
+    """
+    Emits `move dst, src` for every (dst, src) pair as if they all happened at once.
+    Sources that an earlier move would overwrite (e.g. a1 when a1 is also a destination) are copied out of the way first.
+    """
+    written = set()
+    copies: Dict[str, str] = {}
+    for dst, src in moves:
+        if src in written and src not in copies:
+            copy_t = copies[src] = next_tmp()
+            sink.emit(f"move {copy_t}, {src}")
+            if EMIT_COMMENTS:
+                emit_comment(sink, f"{copy_t} = {src}")
+        written.add(dst)
+
+    for dst, src in moves:
+        src = copies.get(src, src)
+        if dst != src:
+            sink.emit(f"move {dst}, {src}")
+            if EMIT_COMMENTS:
+                emit_comment(sink, f"{dst} = {src}")
+
+
+# instructions that never write to their first operand
+_NO_DEST_OPS = frozenset(("hstore", "bz", "bnz", "jmp", "call", "ret"))
+
+
+def _is_register(operand: str) -> bool:
+    # temporary (t#) and argument (a#) registers, as opposed to sap, labels and immediates
+    return operand[0] in "ta" and operand[1:].isdigit()
 
-    @staticmethod
-    def reset():
-        """
-        Resets the generator to re-generate temporary registers starting at L0
-        NOTE: Do not use this at all cost.
-        """
-        LabelGenerator.gen.reset()
 
+def prune_dead_saves(lines: List[str], start: int = 0, returns_value: bool = True):
+    """
+    Removes every save / restore pair (in lines[start:], which must hold exactly one procedure) whose register is not read again before being overwritten.
+    `returns_value` tells whether a0 is still needed once the procedure returns.
+    Calls save every register that might be in use, so registers holding values that are never needed after the call are pushed and popped for nothing.
+    """
+    # line index of each instruction, followed by its opcode and operands
+    at: List[int] = []
+    ops: List[str] = []
+    operands: List[List[str]] = []
+    # label => index of the instruction right after it
+    labels: Dict[str, int] = {}
+    for i in range(start, len(lines)):
+        line = lines[i]
+        if line[0] == "#":
+            continue
+        if line[-1] == ":":
+            labels[line[:-1]] = len(at)
+            continue
+        op, _, rest = line.partition(" ")
+        at.append(i)
+        ops.append(op)
+        operands.append(rest.split(", ") if rest else [])
+
+    if "save" not in ops:
+        return
+
+    # what the caller may still read once the procedure returns
+    ret_live = frozenset(("a0",)) if returns_value else frozenset()
+
+    # saves and restores are emitted around straight-line code, so they pair up like brackets
+    pairs: List[Tuple[int, int]] = []
+    open_saves: List[int] = []
+    for k, op in enumerate(ops):
+        if op == "save":
+            open_saves.append(k)
+        elif op == "restore":
+            if not open_saves or operands[open_saves[-1]][0] != operands[k][0]:
+                # not something we generated, leave it alone
+                return
+            pairs.append((open_saves.pop(), k))
+    if open_saves:
+        return
+
+    # NOTE: saves and restores are treated as neither reading nor writing their register
+    #   a kept pair carries the value across the call untouched, so what matters is whether anything else reads it
+    #   (counting a save as a read would keep every pair inside a loop alive through its own save on the next pass)
+    n = len(ops)
+    uses: List[FrozenSet[str]] = []
+    defs: List[Optional[str]] = []
+    succs: List[Tuple[int, ...]] = []
+    for k, op in enumerate(ops):
+        args = operands[k]
+        if op == "save" or op == "restore":
+            uses.append(frozenset())
+            defs.append(None)
+        elif op == "ret":
+            uses.append(ret_live)
+            defs.append(None)
+        elif op in _NO_DEST_OPS:
+            uses.append(frozenset(a for a in args if _is_register(a)))
+            defs.append(None)
+        else:
+            uses.append(frozenset(a for a in args[1:] if _is_register(a)))
+            defs.append(args[0])
+
+        if op == "jmp":
+            succs.append((labels[args[0]],))
+        elif op == "bz" or op == "bnz":
+            succs.append((k + 1, labels[args[1]]))
+        elif op == "ret":
+            succs.append(())
+        else:
+            succs.append((k + 1,))
+
+    # backwards liveness, repeated until nothing changes
+    # falling off the end of the procedure behaves like ret
+    live_in: List[FrozenSet[str]] = [frozenset()] * n
+    live_out: List[FrozenSet[str]] = [frozenset()] * n
+    changed = True
+    while changed:
+        changed = False
+        for k in range(n - 1, -1, -1):
+            out = frozenset().union(
+                *[live_in[s] if s < n else ret_live for s in succs[k]]
+            )
+            d = defs[k]
+            new_in = uses[k] | (out - {d} if d != None else out)
+            if new_in != live_in[k] or out != live_out[k]:
+                live_in[k] = new_in
+                live_out[k] = out
+                changed = True
+
+    drop = set()
+    for save_k, restore_k in pairs:
+        if operands[restore_k][0] not in live_out[restore_k]:
+            drop.add(at[save_k])
+            drop.add(at[restore_k])
+    if drop:
+        lines[start:] = [
+            line for i, line in enumerate(lines[start:], start) if i not in drop
+        ]
 
-class GlobalTemporaryRegisterGenerator:
-    temp_gen = TemporaryRegisterGenerator()
 
-    @staticmethod
-    def next() -> str:
+# comments are never printed without CODEGEN_DEBUG, and are skipped entirely when running under `python -O`
+# callers check this before building the comment so that the string is never formatted when it would be thrown away
+EMIT_COMMENTS = CODEGEN_DEBUG and __debug__
+
+if EMIT_COMMENTS:
+
+    def emit_comment(sink: "CodeSink", comment: str):
         """
-        Generates a new temporary register that has not been used.
-        NOTE: The generated register may be used by other parts of the program.
-            It is up to the programmer to ensure that the generator is only reset for specific purposes.
+        Adds a comment line to the generated code.
         """
-        return GlobalTemporaryRegisterGenerator.temp_gen.next()
+        sink.emit(f"# {comment}")
+
+else:
+
+    def emit_comment(sink: "CodeSink", comment: str):
+        # comments would never be printed, so there is no point in keeping them
+        pass
+
+
+def _format_line_debug(sub_code: str) -> bytes:
+    """
+    Formats a single line of generated code the way it should appear in the output file (already encoded).
+    """
+    # labels end with ":" and directives start with "." so a single character decides the layout
+    c0 = sub_code[0]
+    if sub_code[-1] == ":" or c0 == ".":
+        line = f"{sub_code}\n"
+    elif c0 == "#":
+        line = f"\t{sub_code}\n\n"
+    else:
+        line = f"\t{sub_code}\n"
+    # generated code only consists of identifiers, numbers and punctuation
+    return line.encode("ascii")
+
+
+def _format_line_release(sub_code: str) -> bytes:
+    """
+    Same as `_format_line_debug`, except comments are dropped entirely.
+    """
+    c0 = sub_code[0]
+    if sub_code[-1] == ":" or c0 == ".":
+        line = f"{sub_code}\n"
+    elif c0 == "#":
+        return b""
+    else:
+        line = f"\t{sub_code}\n"
+    return line.encode("ascii")
+
+
+# output buffer shared by every write instead of allocating a new one per call
+# it is emptied again after each write, so it never holds more than the procedure being written
+_SCRATCH = bytearray()
+
+# the line cache is dropped once it holds this many lines, so its size does not grow with the program
+_LINE_CACHE_LIMIT = 4096
+
 
-    @staticmethod
-    def reset(new_start: Optional[int] = None):
+def _make_line_writer(format_line):
+    """
+    Builds a writer specialized for one formatter, so the per-line loop never has to check CODEGEN_DEBUG.
+    """
+    # formatted output for the lines seen recently (see `_LINE_CACHE_LIMIT`)
+    # generated programs repeat the same lines a lot, so most lines are only formatted once
+    # empty lines are seeded so they never reach the formatter
+    cache: Dict[str, bytes] = {"": b""}
+
+    def write_lines(
+        lines: Iterable[str],
+        file,
+        _cache=cache,
+        _format=format_line,
+        _scratch=_SCRATCH,
+    ):
         """
-        Resets all internal generators so that the next temporary and argument registers are t0 and a0.
+        Every line is collected into a single buffer so the file only sees one write.
+        The file should be opened in binary mode; text files are written through their underlying buffer.
+        NOTE: the buffer is shared between calls, so this is not reentrant or thread-safe.
         """
-        GlobalTemporaryRegisterGenerator.temp_gen.reset(new_start)
+        # lines are copied straight into one buffer instead of being collected into a list and joined afterwards
+        _scratch.clear()
+        # everything the loop touches is bound to a local so each line avoids the global and attribute lookups
+        extend = _scratch.extend
+        for sub_code in lines:
+            if sub_code in _cache:
+                extend(_cache[sub_code])
+            else:
+                line = _cache[sub_code] = _format(sub_code)
+                extend(line)
+
+        if hasattr(file, "buffer"):
+            # make sure anything already written as text lands before our bytes
+            file.flush()
+            file = file.buffer
+        file.write(_scratch)
+        _scratch.clear()
+
+        if len(_cache) > _LINE_CACHE_LIMIT:
+            _cache.clear()
+            _cache[""] = b""
+
+    return write_lines
 
-    @staticmethod
-    def get_curr() -> int:
-        return GlobalTemporaryRegisterGenerator.temp_gen.curr
 
+_write_lines_debug = _make_line_writer(_format_line_debug)
+_write_lines_release = _make_line_writer(_format_line_release)
 
-def print_code(code: "NestedStrList", file):
+
+# output files are opened with a buffer large enough that typical programs are written in a single syscall
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def open_output(path):
+    return open(path, "wb", buffering=_OUTPUT_BUFFER_SIZE)
+
+
+class CodeSink:
     """
-    When we generate code, the DS we use ends up looking like lists within lists within lists.
-    To output this to a file, we need a DFS crawler to ensure every list is covered.
+    A single flat, growable list of lines that code generation appends to.
+    Records emit their lines directly here instead of returning nested lists for their parent to wrap.
     """
-    for sub_code in code:
-        if isinstance(sub_code, str):
-            if (
-                sub_code.endswith(":")
-                or sub_code.startswith(".")
-            ):
-                print(sub_code, file=file)
-            else:
-                if sub_code.startswith("#") and not CODEGEN_DEBUG:
-                    continue
-                print(f"\t{sub_code}", file=file)
-                if sub_code.startswith("#"):
-                    print(file=file)
-        else:
-            print_code(sub_code, file)
+
+    # lines are kept as finished strings rather than (opcode, operands...) tuples rendered at write time
+
+    __slots__ = ("lines", "emit")
+
+    def __init__(self):
+        self.lines: List[str] = []
+        # bound once so every emit is a plain list append
+        self.emit = self.lines.append
+
+    def flush(self):
+        # called whenever a procedure is complete
+        # this sink only collects lines, so there is nothing to do
+        pass
+
+
+class StreamingCodeSink(CodeSink):
+    """
+    A sink that writes its lines to a file every time it is flushed, so only one procedure is held in memory at a time.
+    """
+
+    __slots__ = ("file", "write_lines")
+
+    def __init__(self, file, _debug: bool = CODEGEN_DEBUG):
+        super().__init__()
+        self.file = file
+        self.write_lines = _write_lines_debug if _debug else _write_lines_release
+
+    def flush(self):
+        self.write_lines(self.lines, self.file)
+        # cleared in place because emit is bound to this list
+        self.lines.clear()
@@ -1,30 +1,96 @@
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from abc import ABC, abstractmethod
+from io import StringIO
+from itertools import count
+from typing import Dict, FrozenSet, List, Literal, Optional, Tuple, Union
 from decaf_absmc import (
+    EMIT_COMMENTS,
     ArgumentRegisterGenerator,
-    GlobalTemporaryRegisterGenerator,
-    LabelGenerator,
+    CodeSink,
     TemporaryRegisterGenerator,
+    const_tmp,
+    cur_tmp,
+    emit_comment,
+    emit_moves,
+    next_label,
+    next_tmp,
+    next_tmps,
+    prune_dead_saves,
+    reset_tmp,
+    restore_consts,
+    save_consts,
 )
-from decaf_util import Counter, NestedStrList
+from decaf_util import Counter
 
+# modifier values; the parser only ever hands out these objects, so they are compared with `is`
+PUBLIC = "public"
+PRIVATE = "private"
+STATIC = "static"
+INSTANCE = "instance"
 
-class TypeRecord:
+
+class CodeGenContext:
+    """
+    Carries the state that code generation hands down from a procedure or loop to the code nested inside it.
+    A single instance is shared by the whole pass and updated in place, instead of copying a dict at every call.
+    """
+
+    __slots__ = ("self_t", "loop_test_l", "loop_end_l")
+
+    def __init__(self):
+        # register holding the current object reference (None inside static methods)
+        self.self_t: Optional[str] = None
+
+        # labels that continue / break jump to (None outside of loops)
+        self.loop_test_l: Optional[str] = None
+        self.loop_end_l: Optional[str] = None
+
+    def enter_loop(
+        self, loop_test_l: str, loop_end_l: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Points continue / break at the given labels. Returns the labels of the enclosing loop to pass to `exit_loop`.
+        """
+        outer = (self.loop_test_l, self.loop_end_l)
+        self.loop_test_l = loop_test_l
+        self.loop_end_l = loop_end_l
+        return outer
+
+    def exit_loop(self, outer: Tuple[Optional[str], Optional[str]]):
+        """
+        Restores the labels of the enclosing loop.
+        """
+        self.loop_test_l, self.loop_end_l = outer
+
+
+class TypeRecord(ABC):
     """
     Assigned: @BrianShao123
     """
 
+    __slots__ = ("type",)
+
     def __init__(self, type: str):
         self.type = type
 
+    @abstractmethod
     def __repr__(self):
         # purposely added here because sub-classes are supposed to implement this
-        raise Exception("Not implemented")
+        pass
 
 
 class BuiltInTypeRecord(TypeRecord):
+    __slots__ = ("bit", "subtype_mask")
+
+    id_gen = count(0).__next__
+
     def __init__(self, type: str):
         super().__init__(type)
 
+        # every built-in type owns a single bit
+        # subtype_mask has the bit of every built-in type that is a subtype of this one
+        self.bit = 1 << BuiltInTypeRecord.id_gen()
+        self.subtype_mask = self.bit
+
     def __repr__(self):
         return self.type
 
@@ -33,7 +99,7 @@ class BuiltInTypeRecordCollection:
     """
     This collection contains a bunch of built-in types the program recognizes.
     Whenever we need a BuiltInTypeRecord, we use the ones from this collection.
-    This will help with == checks during type checking.
+    This will help with identity (`is`) checks during type checking.
     """
 
     INT = BuiltInTypeRecord("int")
@@ -44,6 +110,13 @@ class BuiltInTypeRecordCollection:
     NULL = BuiltInTypeRecord("null")
     ERROR = BuiltInTypeRecord("error")
 
+    # every built-in type is a subtype of itself
+    # on top of that, ints can be used wherever floats are expected
+    FLOAT.subtype_mask |= INT.bit
+
+    # except for error, which is never a subtype of anything (not even itself)
+    ERROR.subtype_mask = 0
+
 
 class UserTypeRecord(TypeRecord):
     """
@@ -51,6 +124,8 @@ class UserTypeRecord(TypeRecord):
     Ex: The bob in bob.some_instance_method() has type T.
     """
 
+    __slots__ = ()
+
     def __init__(self, type: str):
         super().__init__(type)
 
@@ -64,6 +139,8 @@ class ClassLiteralTypeRecord(TypeRecord):
     Ex: The A in A.some_static_method() has type Class<A>.
     """
 
+    __slots__ = ()
+
     def __init__(self, type: str):
         super().__init__(type)
 
@@ -72,6 +149,17 @@ class ClassLiteralTypeRecord(TypeRecord):
 
 
 class ClassRecord:
+    __slots__ = (
+        "name",
+        "super_class_name",
+        "constructors",
+        "methods",
+        "method_map",
+        "fields",
+        "field_map",
+        "size",
+    )
+
     def __init__(
         self,
         name: str,
@@ -91,72 +179,109 @@ class ClassRecord:
             )
 
         self.methods = methods
-        self.method_map: Dict[str, "MethodRecord"] = {}
+        # keyed by (applicability, name) so lookups never have to format a key
+        self.method_map: Dict[Tuple[str, str], "MethodRecord"] = {}
         for m in methods:
-            key = f"{m.applicability}:{m.name}"
+            key = (m.applicability, m.name)
             if key in self.method_map:
                 raise Exception(
-                    f"A04 constraints do not allow overloaded method: {key}"
+                    f"A04 constraints do not allow overloaded method: {m.applicability}:{m.name}"
                 )
             self.method_map[key] = m
 
         self.fields = fields
-        self.field_map: Dict[str, "FieldRecord"] = {}
+        self.field_map: Dict[Tuple[str, str], "FieldRecord"] = {}
         for f in fields:
-            key = f"{f.applicability}:{f.name}"
+            key = (f.applicability, f.name)
             if key in self.field_map:
-                raise Exception(f"duplicate field name: {key}")
+                raise Exception(f"duplicate field name: {f.applicability}:{f.name}")
             self.field_map[key] = f
 
         # this field represents the total # of slots required to fit an instance of this class
         # the total # includes slots to fit super and super... classes
-        # this will be computed during code generation
+        # this will be computed when the class is registered into the dependency tree
         self.size: int = None
 
-    def generate_code(self, **context) -> "NestedStrList":
-        out = []
-
+    def generate_code(self, sink: "CodeSink"):
+        ctx = CodeGenContext()
         for c in self.constructors:
-            out.append(c.generate_code(**context))
+            # constructors hand the object address back in a0 (see NewObjectExpressionRecord)
+            ClassRecord.__generate_procedure(sink, ctx, c, True)
 
         for m in self.methods:
-            out.append(m.generate_code(**context))
+            ClassRecord.__generate_procedure(
+                sink, ctx, m, m.return_type is not BuiltInTypeRecordCollection.VOID
+            )
 
-        return out
+    @staticmethod
+    def __generate_procedure(
+        sink: "CodeSink",
+        ctx: "CodeGenContext",
+        procedure: Union["ConstructorRecord", "MethodRecord"],
+        returns_value: bool,
+    ):
+        # every procedure is cleaned up on its own before it is written out
+        start = len(sink.lines)
+        procedure.generate_code(sink, ctx)
+        prune_dead_saves(sink.lines, start, returns_value)
+        sink.flush()
+
+    def write_repr(self, buf: "StringIO"):
+        """
+        Writes the same text as `repr` into `buf`.
+        Constructors and methods write straight into the same buffer instead of building their own strings first.
+        """
+        buf.write(f"Class Name: {self.name}\n")
+        buf.write(f"Superclass Name: {self.super_class_name or ''}\n")
+        buf.write("Fields:")
+        for f in self.fields:
+            buf.write("\n")
+            buf.write(repr(f))
+        buf.write("\nConstructors:")
+        for c in self.constructors:
+            buf.write("\n")
+            c.write_repr(buf)
+        buf.write("\nMethods:")
+        for m in self.methods:
+            buf.write("\n")
+            m.write_repr(buf)
 
     def __repr__(self):
-        return "\n".join(
-            [
-                f"Class Name: {self.name}",
-                f"Superclass Name: {self.super_class_name or ''}",
-                "Fields:",
-                *map(repr, self.fields),
-                "Constructors:",
-                *map(repr, self.constructors),
-                "Methods:",
-                *map(repr, self.methods),
-            ]
-        )
+        buf = StringIO()
+        self.write_repr(buf)
+        return buf.getvalue()
 
 
 class DependencyTreeNode:
+    __slots__ = (
+        "parent",
+        "record",
+        "subclasses",
+        "ancestor_names",
+        "fields",
+        "methods",
+    )
+
     def __init__(self, record: "ClassRecord"):
         self.parent: Optional["DependencyTreeNode"] = None
         self.record = record
         self.subclasses: List["DependencyTreeNode"] = []
+        # names of this class and every class it extends
+        # the tree only grows, so this never has to be recomputed once the node is registered
+        self.ancestor_names: FrozenSet[str] = frozenset()
+        # (applicability, name) => record, for every field / method visible from this class
+        #   members of this class hide the ones with the same key in the classes it extends
+        self.fields: Dict[Tuple[str, str], "FieldRecord"] = {}
+        self.methods: Dict[Tuple[str, str], "MethodRecord"] = {}
 
 
 class DependencyTree:
-    BUILTIN_SUBTYPES = {
-        BuiltInTypeRecordCollection.INT: [],
-        BuiltInTypeRecordCollection.FLOAT: [BuiltInTypeRecordCollection.INT],
-        BuiltInTypeRecordCollection.BOOLEAN: [],
-        BuiltInTypeRecordCollection.STRING: [],
-    }
-
     DEPENDENCY_TREE_ROOT = DependencyTreeNode(None)
     CLASS_NAME_TO_NODE: Dict[str, "DependencyTreeNode"] = {}
 
+    # gives every static field of every class an unique offset from the base $sap
+    STATIC_OFFSET_GEN = Counter(0)
+
     @staticmethod
     def register_class(record: "ClassRecord"):
         """
@@ -181,14 +306,28 @@ class DependencyTree:
 
         node = DependencyTreeNode(record)
         node.parent = parent
+        node.ancestor_names = parent.ancestor_names | {name}
+        # the super class is registered first, so its flattened members are already complete
+        node.fields = {**parent.fields, **record.field_map}
+        node.methods = {**parent.methods, **record.method_map}
         parent.subclasses.append(node)
         DependencyTree.CLASS_NAME_TO_NODE[name] = node
 
-    @staticmethod
-    def __builtin_is_subtype(a: "BuiltInTypeRecord", b: "BuiltInTypeRecord") -> bool:
-        if a == b:
-            return True
-        return a in DependencyTree.BUILTIN_SUBTYPES[b]
+        # the super class is always registered first, so its layout is already known
+        # instance fields begin at the end of the super class slots
+        super_size = 0 if parent.record == None else parent.record.size
+        # each kind of field takes consecutive slots in declaration order
+        static_fields = [f for f in record.fields if f.applicability is STATIC]
+        instance_fields = [f for f in record.fields if f.applicability is not STATIC]
+
+        static_offset_gen = DependencyTree.STATIC_OFFSET_GEN
+        for offset, f in enumerate(static_fields, static_offset_gen.curr):
+            f.offset = offset
+        static_offset_gen.curr += len(static_fields)
+
+        for offset, f in enumerate(instance_fields, super_size):
+            f.offset = offset
+        record.size = super_size + len(instance_fields)
 
     @staticmethod
     def __classname_is_subtype(a: str, b: str) -> bool:
@@ -197,108 +336,108 @@ class DependencyTree:
         if b not in DependencyTree.CLASS_NAME_TO_NODE:
             raise Exception(f"unknown class name: {b}")
 
-        curr = DependencyTree.CLASS_NAME_TO_NODE[a]
-        target = DependencyTree.CLASS_NAME_TO_NODE[b]
-        while curr != None:
-            if curr == target:
-                return True
-            curr = curr.parent
-        return False
+        return b in DependencyTree.CLASS_NAME_TO_NODE[a].ancestor_names
+
+    # (type of a, type of b) => whether a is a subtype of b
+    # any pairing not listed here is never a subtype
+    # NOTE: the type records have no subclasses, so looking up the exact types is equivalent to isinstance checks
+    # NOTE: pairs of built-in types are handled by `is_subtype` before this table is consulted
+    SUBTYPE_DISPATCH = {
+        (BuiltInTypeRecord, UserTypeRecord): (
+            lambda a, b: a is BuiltInTypeRecordCollection.NULL
+        ),
+        (UserTypeRecord, UserTypeRecord): (
+            lambda a, b: DependencyTree.__classname_is_subtype(a.type, b.type)
+        ),
+        (ClassLiteralTypeRecord, ClassLiteralTypeRecord): (
+            lambda a, b: DependencyTree.__classname_is_subtype(a.type, b.type)
+        ),
+    }
 
     @staticmethod
     def is_subtype(a: "TypeRecord", b: "TypeRecord") -> bool:
         """
         Returns True if `a` is a subtype of `b`. Returns False otherwise.
         """
-        if a == BuiltInTypeRecordCollection.ERROR:
+        # most checks compare two built-in types, so they skip the dispatch table entirely
+        # NOTE: error has an empty subtype mask, so it never passes this check on either side
+        if type(a) is BuiltInTypeRecord and type(b) is BuiltInTypeRecord:
+            return b.subtype_mask & a.bit != 0
+
+        if a is BuiltInTypeRecordCollection.ERROR:
             return False
-        if b == BuiltInTypeRecordCollection.ERROR:
+        if b is BuiltInTypeRecordCollection.ERROR:
             return False
 
-        if isinstance(a, BuiltInTypeRecord):
-            if isinstance(b, BuiltInTypeRecord):
-                return DependencyTree.__builtin_is_subtype(a, b)
-            elif isinstance(b, UserTypeRecord):
-                return a == BuiltInTypeRecordCollection.NULL
-        elif isinstance(a, UserTypeRecord) and isinstance(b, UserTypeRecord):
-            return DependencyTree.__classname_is_subtype(a.type, b.type)
-        elif isinstance(a, ClassLiteralTypeRecord) and isinstance(
-            b, ClassLiteralTypeRecord
-        ):
-            return DependencyTree.__classname_is_subtype(a.type, b.type)
+        handler = DependencyTree.SUBTYPE_DISPATCH.get((type(a), type(b)))
+        if handler == None:
+            return False
+        return handler(a, b)
 
-        return False
+    @staticmethod
+    def get_static_size() -> int:
+        """
+        Returns the number of static slots needed by every class registered so far.
+        """
+        return DependencyTree.STATIC_OFFSET_GEN.curr
 
     @staticmethod
     def get_class_record(name: str) -> Optional["ClassRecord"]:
         """
         Takes a class name that returns the class record if any.
         """
-        if name in DependencyTree.CLASS_NAME_TO_NODE:
-            return DependencyTree.CLASS_NAME_TO_NODE[name].record
-        return None
-
-    @staticmethod
-    def __resolve_field(
-        class_node: "DependencyTreeNode", key: str
-    ) -> Optional["FieldRecord"]:
-        if class_node == DependencyTree.DEPENDENCY_TREE_ROOT:
+        node = DependencyTree.CLASS_NAME_TO_NODE.get(name)
+        if node == None:
             return None
-
-        if key in class_node.record.field_map:
-            return class_node.record.field_map[key]
-
-        return DependencyTree.__resolve_field(class_node.parent, key)
+        return node.record
 
     @staticmethod
     def resolve_field(
         class_name: str, field_name: str, is_static: bool
     ) -> Optional["FieldRecord"]:
-        if class_name in DependencyTree.CLASS_NAME_TO_NODE:
-            app = "static" if is_static else "instance"
-            key = f"{app}:{field_name}"
-            field = DependencyTree.__resolve_field(
-                DependencyTree.CLASS_NAME_TO_NODE[class_name], key
-            )
-            if field != None and field.applicability != app:
-                raise Exception(
-                    f"illegal program state - expected {app} but got a field with {field.applicability} instead"
-                )
-            return field
-        return None
-
-    @staticmethod
-    def __resolve_method(
-        class_node: "DependencyTreeNode", key: str
-    ) -> Optional["MethodRecord"]:
-        if class_node == DependencyTree.DEPENDENCY_TREE_ROOT:
+        class_node = DependencyTree.CLASS_NAME_TO_NODE.get(class_name)
+        if class_node == None:
             return None
 
-        if key in class_node.record.method_map:
-            return class_node.record.method_map[key]
+        app = STATIC if is_static else INSTANCE
+        field = class_node.fields.get((app, field_name))
 
-        return DependencyTree.__resolve_method(class_node.parent, key)
+        if field != None and field.applicability is not app:
+            raise Exception(
+                f"illegal program state - expected {app} but got a field with {field.applicability} instead"
+            )
+        return field
 
     @staticmethod
     def resolve_method(
         class_name: str, method_name: str, is_static: bool
     ) -> Optional["MethodRecord"]:
-        if class_name in DependencyTree.CLASS_NAME_TO_NODE:
-            app = "static" if is_static else "instance"
-            key = f"{app}:{method_name}"
-            method = DependencyTree.__resolve_method(
-                DependencyTree.CLASS_NAME_TO_NODE[class_name], key
+        class_node = DependencyTree.CLASS_NAME_TO_NODE.get(class_name)
+        if class_node == None:
+            return None
+
+        app = STATIC if is_static else INSTANCE
+        method = class_node.methods.get((app, method_name))
+
+        if method != None and method.applicability is not app:
+            raise Exception(
+                f"illegal program state - expected {app} but got a method_name with {method.applicability} instead"
             )
-            if method != None and method.applicability != app:
-                raise Exception(
-                    f"illegal program state - expected {app} but got a method_name with {method.applicability} instead"
-                )
-            return method
-        return None
+        return method
 
 
 class ConstructorRecord:
-    id_gen = Counter(1)
+    __slots__ = (
+        "id",
+        "visibility",
+        "parameters",
+        "variable_table",
+        "body",
+        "containing_class",
+        "label",
+    )
+
+    id_gen = count(1).__next__
 
     def __init__(
         self,
@@ -308,19 +447,22 @@ class ConstructorRecord:
         variable_table: List["VariableRecord"],
         containing_class: str,
     ):
-        self.id = ConstructorRecord.id_gen.next()
+        self.id = ConstructorRecord.id_gen()
         self.visibility = visibility
         self.parameters = parameters
         self.body = body
         self.variable_table = variable_table
         self.containing_class = containing_class
 
+        # the id never changes, so the label is only formatted once
+        self.label = f"C_{self.id}"
+
     def get_label(self) -> str:
-        return f"C_{self.id}"
+        return self.label
 
-    def generate_code(self, **context) -> "NestedStrList":
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # we need fresh pool of registers
-        GlobalTemporaryRegisterGenerator.reset()
+        reset_tmp()
 
         self_l = self.get_label()
 
@@ -335,36 +477,64 @@ class ConstructorRecord:
                 raise Exception("argument somehow got assigned with register already")
             v.value_reg = arg_gen.next()
 
-        # we dont use **{**context, ...} because it is not expected for self_t to be specified in context already
-        body_code = self.body.generate_code(**context, self_t=this_a)
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"{self.containing_class} constructor")
+        sink.emit(f"{self_l}:")
+
+        ctx.self_t = this_a
+        self.body.generate_code(sink, ctx)
 
         # NOTE: A05 contraints state that constructors do not have return statements
         #   so we need to add one to make sure the control stack is actually updated once the procedure finishes
-        return [
-            f"# {self.containing_class} constructor",
-            f"{self_l}:",
-            body_code,
-            "ret",
-        ]
+        # $a0 is never overwritten (this cannot be assigned), so the caller finds the new object there
+        sink.emit("ret")
+
+    def write_repr(self, buf: "StringIO"):
+        """
+        Writes the same text as `repr` into `buf`.
+        """
+        params = ", ".join([str(r.id) for r in self.parameters])
+        buf.write(f"CONSTRUCTOR: {self.id}, {self.visibility}\n")
+        buf.write(f"Constructor Parameters: {params}\n")
+        buf.write("Variable Table:\n")
+        for v in self.variable_table:
+            buf.write(v.get_table_details())
+            buf.write("\n")
+        buf.write("Constructor Body:\n")
+        buf.write(repr(self.body))
 
     def __repr__(self):
-        params = ", ".join(map(lambda r: str(r.id), self.parameters))
-        return "\n".join(
-            [
-                f"CONSTRUCTOR: {self.id}, {self.visibility}",
-                f"Constructor Parameters: {params}",
-                "Variable Table:",
-                *map(lambda v: v.get_table_details(), self.variable_table),
-                "Constructor Body:",
-                repr(self.body),
-            ]
-        )
+        buf = StringIO()
+        self.write_repr(buf)
+        return buf.getvalue()
 
 
 ExprRange = Tuple[int, int]
 
+# (line, line) => the same tuple, so nodes that sit on a single line share their range
+_LINE_RANGES: Dict[int, ExprRange] = {}
+
+
+def line_range(line: int) -> ExprRange:
+    """
+    Returns the range covering only `line`, shared by every node on that line.
+    """
+    r = _LINE_RANGES.get(line)
+    if r == None:
+        r = _LINE_RANGES[line] = (line, line)
+    return r
+
+
+class ExpressionRecord(ABC):
+    __slots__ = ("location", "type", "value_reg", "effects")
+
+    # bits of `effects`, describing what evaluating the expression may do besides producing its value
+    READS_HEAP = 1
+    WRITES_HEAP = 2
+    WRITES_VARIABLES = 4
+    CALLS = 8
+    READS_VARIABLES = 16
 
-class ExpressionRecord:
     def __init__(self, location: ExprRange, type: Optional["TypeRecord"]):
         self.location = location
         self.type = type
@@ -373,38 +543,69 @@ class ExpressionRecord:
         # this is expected to set during code generation
         self.value_reg: str = None
 
+        # constants have no effects
+        # expressions built from other expressions set this during type resolving
+        self.effects = 0
+
     def compute_type(self, **context) -> "TypeRecord":
         """
         Override this method to determine the type during type checking
         """
         raise Exception("not implemented")
 
+    def discard_value(self):
+        """
+        Called on expressions whose value is never read (expression statements, for-loop init / update).
+        Expressions that only copy their result into a register of its own for the reader can skip that copy.
+        """
+        pass
+
+    def read_vars(self) -> int:
+        """
+        Returns the variables evaluating this expression may read, as a bitset of `1 << VariableRecord.id`.
+        """
+        # constants and object / class references read no variables
+        return 0
+
+    def assigned_vars(self) -> int:
+        """
+        Returns the variables evaluating this expression may assign, as a bitset of `1 << VariableRecord.id`.
+        """
+        return 0
+
     def resolve_type(self, **context) -> "TypeRecord":
-        if self.type != None:
-            return self.type
+        # the type is memoized on the record, so every later call (including all of code generation) only reads it
+        resolved = self.type
+        if resolved != None:
+            return resolved
 
-        self.type = self.compute_type(**context)
-        if self.type == BuiltInTypeRecordCollection.ERROR:
+        resolved = self.type = self.compute_type(**context)
+        if resolved is BuiltInTypeRecordCollection.ERROR:
             raise Exception(f"uncaught type error at lines {self.location}")
 
-        return self.type
+        return resolved
 
-    def generate_code(self, **context) -> "NestedStrList":
+    @abstractmethod
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # subclasses need to implement this to support code generation
+        # instructions are appended to the sink in order, nothing is returned
         # remember to set self.value_reg
-        raise Exception("not implemented")
+        pass
 
     def get_value_register(self) -> str:
         if self.value_reg == None:
             raise Exception(f"tried to use register, but it is not set - {self}")
         return self.value_reg
 
+    @abstractmethod
     def __repr__(self):
         # purposely added here because sub-classes are supposed to implement this
-        raise Exception("not implemented")
+        pass
 
 
 class ConstantExpressionRecord(ExpressionRecord):
+    __slots__ = ("value",)
+
     def __init__(
         self,
         location: ExprRange,
@@ -414,32 +615,32 @@ class ConstantExpressionRecord(ExpressionRecord):
         super().__init__(location, type)
         self.value = value
 
+    @abstractmethod
     def get_value_string(self) -> str:
         # purposely added here because sub-classes are supposed to implement this
-        raise Exception("not implemented")
+        pass
 
     def __repr__(self):
         return f"Constant({self.get_value_string()})"
 
 
 class NullConstantExpressionRecord(ConstantExpressionRecord):
+    __slots__ = ()
+
     def __init__(self, location: ExprRange):
         super().__init__(location, None, BuiltInTypeRecordCollection.NULL)
 
     def get_value_string(self):
         return "Null"
 
-    def generate_code(self, **context):
-        out_t = GlobalTemporaryRegisterGenerator.next()
-        self.value_reg = out_t
-
-        return [
-            f"move_immed_i {out_t}, 0",
-            f"# {out_t} = null",
-        ]
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        # null is never cast or updated in place, so it can share the register of an already loaded 0
+        self.value_reg = const_tmp(sink, "move_immed_i", 0)
 
 
 class StringConstantExpressionRecord(ConstantExpressionRecord):
+    __slots__ = ()
+
     def __init__(self, location: ExprRange, value: str):
         super().__init__(location, value, BuiltInTypeRecordCollection.STRING)
 
@@ -447,39 +648,49 @@ class StringConstantExpressionRecord(ConstantExpressionRecord):
         # use repr to keep escaped characters
         return f"String-constant({repr(self.value)})"
 
-    def generate_code(self, **context):
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         raise Exception("A05 constraints does not support strings")
 
 
 class FloatConstantExpressionRecord(ConstantExpressionRecord):
+    __slots__ = ()
+
     def __init__(self, location: ExprRange, value: float):
         super().__init__(location, value, BuiltInTypeRecordCollection.FLOAT)
 
     def get_value_string(self):
         return f"Float-constant({str(self.value)})"
 
-    def generate_code(self, **context):
-        out_t = GlobalTemporaryRegisterGenerator.next()
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        out_t = next_tmp()
         self.value_reg = out_t
 
-        return [f"move_immed_f {out_t}, {self.value}", f"# {out_t} = {self.value}"]
+        sink.emit(f"move_immed_f {out_t}, {self.value}")
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"{out_t} = {self.value}")
 
 
 class IntegerConstantExpressionRecord(ConstantExpressionRecord):
+    __slots__ = ()
+
     def __init__(self, location: ExprRange, value: int):
         super().__init__(location, value, BuiltInTypeRecordCollection.INT)
 
     def get_value_string(self):
         return f"Integer-constant({str(self.value)})"
 
-    def generate_code(self, **context):
-        out_t = GlobalTemporaryRegisterGenerator.next()
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        out_t = next_tmp()
         self.value_reg = out_t
 
-        return [f"move_immed_i {out_t}, {self.value}", f"# {out_t} = {self.value}"]
+        sink.emit(f"move_immed_i {out_t}, {self.value}")
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"{out_t} = {self.value}")
 
 
 class BooleanConstantExpressionRecord(ConstantExpressionRecord):
+    __slots__ = ()
+
     CODE_TRUE = 1
     CODE_FALSE = 0
 
@@ -489,26 +700,24 @@ class BooleanConstantExpressionRecord(ConstantExpressionRecord):
     def get_value_string(self):
         return str(self.value)
 
-    def generate_code(self, **context):
-        out_t = GlobalTemporaryRegisterGenerator.next()
-        self.value_reg = out_t
-
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         b = (
             BooleanConstantExpressionRecord.CODE_TRUE
             if self.value
             else BooleanConstantExpressionRecord.CODE_FALSE
         )
 
-        return [
-            f"move_immed_i {out_t}, {b}",
-            f"# {out_t} = {self.value}",
-        ]
+        # booleans are never cast or updated in place, so they can share the register of an already loaded 0 / 1
+        self.value_reg = const_tmp(sink, "move_immed_i", b)
 
 
 class VarExpressionRecord(ExpressionRecord):
+    __slots__ = ("value", "variable")
+
     def __init__(self, location: ExprRange, variable: "VariableRecord"):
         super().__init__(location, variable.type)
         self.value = variable.id
+        self.effects = ExpressionRecord.READS_VARIABLES
 
         # NOTE: regarding code generation
         #   Even though we have access to the variable record, we cannot assign the expression register right now.
@@ -516,21 +725,27 @@ class VarExpressionRecord(ExpressionRecord):
         #   Instead, we conduct the assignment during code generation.
         self.variable = variable
 
-    def generate_code(self, **context):
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # we do not create new temporary register
         # we want to share the same register as the referenced variable
         self.value_reg = self.variable.get_value_register()
 
         # no code needed to set register
-        return [
-            f"# ref {self.value_reg} for {self.variable} aka {self.variable.name}",
-        ]
+        if EMIT_COMMENTS:
+            emit_comment(
+                sink, f"ref {self.value_reg} for {self.variable} aka {self.variable.name}"
+            )
+
+    def read_vars(self):
+        return 1 << self.variable.id
 
     def __repr__(self):
         return f"Variable({self.value})"
 
 
 class UnaryExpressionRecord(ExpressionRecord):
+    __slots__ = ("operator", "expr")
+
     def __init__(
         self,
         location: ExprRange,
@@ -544,6 +759,7 @@ class UnaryExpressionRecord(ExpressionRecord):
 
     def compute_type(self, **context):
         e_type = self.expr.resolve_type(**context)
+        self.effects = self.expr.effects
 
         # handle uminus case
         if self.operator == "uminus":
@@ -557,51 +773,55 @@ class UnaryExpressionRecord(ExpressionRecord):
             )
 
         # handle neg case
-        if e_type == BuiltInTypeRecordCollection.BOOLEAN:
+        if e_type is BuiltInTypeRecordCollection.BOOLEAN:
             return e_type
         raise Exception(f"negation expected a boolean at lines {self.location}")
 
-    def generate_code(self, **context):
-        expr_code = self.expr.generate_code(**context)
-        expr_t = self.expr.get_value_register()
+    def read_vars(self):
+        return self.expr.read_vars()
 
-        offset_t = GlobalTemporaryRegisterGenerator.next()
+    def assigned_vars(self):
+        return self.expr.assigned_vars()
 
-        out_t = GlobalTemporaryRegisterGenerator.next()
-        self.value_reg = out_t
-        if self.operator == "unminus":
-            if self.expr.type == BuiltInTypeRecordCollection.INT:
-                return [
-                    expr_code,
-                    f"move_immed_i {offset_t}, -1",
-                    f"# {offset_t} = -1",
-                    f"imul {out_t}, {offset_t}, {expr_t}",
-                    f"# {out_t} = -{expr_t}",
-                ]
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        self.expr.generate_code(sink, ctx)
+        expr_t = self.expr.get_value_register()
+
+        if self.operator == "uminus":
+            out_t = next_tmp()
+            self.value_reg = out_t
+
+            if self.expr.type is BuiltInTypeRecordCollection.INT:
+                # there is no negation instruction, but x - x - x = -x needs no constant register
+                sink.emit(f"isub {out_t}, {expr_t}, {expr_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(sink, f"{out_t} = 0")
+                sink.emit(f"isub {out_t}, {out_t}, {expr_t}")
             else:
                 # if not INT, then must be a float
-                return [
-                    expr_code,
-                    f"move_immed_f {offset_t}, -1.0",
-                    f"# {offset_t} = -1.0",
-                    f"fmul {out_t}, {offset_t}, {expr_t}",
-                    f"# {out_t} = -{expr_t}",
-                ]
+                # x - x is not 0.0 when x is infinite, so floats still multiply by -1.0
+                offset_t = const_tmp(sink, "move_immed_f", -1.0)
+                sink.emit(f"fmul {out_t}, {offset_t}, {expr_t}")
+            if EMIT_COMMENTS:
+                emit_comment(sink, f"{out_t} = -{expr_t}")
+            return
 
         # if not uminus, then must be negation
-        return [
-            expr_code,
-            f"move_immed_i {offset_t}, 1",
-            f"# {offset_t} = 1",
-            f"isub {out_t}, {offset_t}, {expr_t}",
-            f"# {out_t} = !{expr_t}",
-        ]
+        offset_t = const_tmp(sink, "move_immed_i", 1)
+        out_t = next_tmp()
+        self.value_reg = out_t
+
+        sink.emit(f"isub {out_t}, {offset_t}, {expr_t}")
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"{out_t} = !{expr_t}")
 
     def __repr__(self):
         return f"Unary({self.operator}, {self.expr})"
 
 
 class BinaryExpressionRecord(ExpressionRecord):
+    __slots__ = ("operator", "left", "right")
+
     def __init__(
         self,
         location: ExprRange,
@@ -627,13 +847,33 @@ class BinaryExpressionRecord(ExpressionRecord):
         self.left = left
         self.right = right
 
+    NUM_TYPES = frozenset(
+        (BuiltInTypeRecordCollection.INT, BuiltInTypeRecordCollection.FLOAT)
+    )
+
+    # (operator, left type, right type) => result type, for operands that are both built-in types
+    # built-in types are singletons, so the same few combinations show up over and over again
+    BUILTIN_RESULT_TYPES: Dict[Tuple[str, "TypeRecord", "TypeRecord"], "TypeRecord"] = {}
+
     def compute_type(self, **context):
         left_type = self.left.resolve_type(**context)
         right_type = self.right.resolve_type(**context)
-        allowed_num_types = (
-            BuiltInTypeRecordCollection.INT,
-            BuiltInTypeRecordCollection.FLOAT,
-        )
+        self.effects = self.left.effects | self.right.effects
+
+        key = (self.operator, left_type, right_type)
+        if key in BinaryExpressionRecord.BUILTIN_RESULT_TYPES:
+            return BinaryExpressionRecord.BUILTIN_RESULT_TYPES[key]
+
+        out = self.__compute_type(left_type, right_type)
+        if (
+            type(left_type) is BuiltInTypeRecord
+            and type(right_type) is BuiltInTypeRecord
+        ):
+            BinaryExpressionRecord.BUILTIN_RESULT_TYPES[key] = out
+        return out
+
+    def __compute_type(self, left_type: "TypeRecord", right_type: "TypeRecord"):
+        allowed_num_types = BinaryExpressionRecord.NUM_TYPES
         match self.operator:
             case "add" | "sub" | "mul" | "div":
                 if left_type in allowed_num_types and right_type in allowed_num_types:
@@ -646,8 +886,8 @@ class BinaryExpressionRecord(ExpressionRecord):
                 )
             case "and" | "or":
                 if (
-                    left_type == BuiltInTypeRecordCollection.BOOLEAN
-                    and right_type == BuiltInTypeRecordCollection.BOOLEAN
+                    left_type is BuiltInTypeRecordCollection.BOOLEAN
+                    and right_type is BuiltInTypeRecordCollection.BOOLEAN
                 ):
                     return BuiltInTypeRecordCollection.BOOLEAN
                 raise Exception(
@@ -660,6 +900,12 @@ class BinaryExpressionRecord(ExpressionRecord):
                     f"`{self.operator}` operation only expected integers and floats at lines {self.location}"
                 )
             case "eq" | "neq":
+                # identical types are always subtypes of each other (except for the error type)
+                if (
+                    left_type is right_type
+                    and left_type is not BuiltInTypeRecordCollection.ERROR
+                ):
+                    return BuiltInTypeRecordCollection.BOOLEAN
                 if DependencyTree.is_subtype(
                     left_type, right_type
                 ) or DependencyTree.is_subtype(right_type, left_type):
@@ -668,60 +914,75 @@ class BinaryExpressionRecord(ExpressionRecord):
                     f"`{self.operator}` operation expected one of the operands to be a subtype of the other at lines {self.location}"
                 )
 
-    def generate_code(self, **context):
-        out = [
-            self.left.generate_code(**context),
-            self.right.generate_code(**context),
-        ]
+    def read_vars(self):
+        return self.left.read_vars() | self.right.read_vars()
+
+    def assigned_vars(self):
+        return self.left.assigned_vars() | self.right.assigned_vars()
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        left, right = self.left, self.right
+        if (
+            right.effects & ExpressionRecord.CALLS
+            and not right.effects & ExpressionRecord.WRITES_VARIABLES
+            and not left.effects & ~ExpressionRecord.READS_VARIABLES
+        ):
+            # every temporary holding a value across a call has to be saved and restored around it
+            #   so when only the right operand makes calls, it is evaluated first and the left operand is never held across them
+            # NOTE: this is only done when the left operand cannot observe the difference
+            #   it reads nothing but variables, and the right operand does not write any variables
+            right.generate_code(sink, ctx)
+            left.generate_code(sink, ctx)
+        else:
+            left.generate_code(sink, ctx)
+            right.generate_code(sink, ctx)
         left_t = self.left.get_value_register()
         right_t = self.right.get_value_register()
 
-        out_t = GlobalTemporaryRegisterGenerator.next()
+        # read once up front instead of going through self in every branch
+        operator = self.operator
+        left_type = self.left.type
+        right_type = self.right.type
+
+        # equality needs a second register for the extra comparison, so both are reserved together
+        if operator == "eq" or operator == "neq":
+            out_t, comp_t = next_tmps(2)
+        else:
+            out_t = next_tmp()
         self.value_reg = out_t
-        match self.operator:
+
+        match operator:
             case "add" | "sub" | "mul" | "div":
-                if self.type == BuiltInTypeRecordCollection.INT:
+                if self.type is BuiltInTypeRecordCollection.INT:
                     # the result is INT, which means both operands are INT
-                    return [
-                        out,
-                        f"i{self.operator} {out_t}, {left_t}, {right_t}",
-                        f"# {out_t} = {left_t} {self.operator} {right_t}",
-                    ]
+                    sink.emit(f"i{operator} {out_t}, {left_t}, {right_t}")
                 else:
                     # the result is FLOAT, which means 1-2 operands are FLOAT
 
                     # if an operand is INT, we need an extra instruction for casting
-                    if self.left.type == BuiltInTypeRecordCollection.INT:
-                        out.append(
-                            [
-                                f"itof {left_t}, {left_t}",
-                                f"# {left_t} = (float) {left_t}",
-                            ]
-                        )
-                    if self.right.type == BuiltInTypeRecordCollection.INT:
-                        out.append(
-                            [
-                                f"itof {right_t}, {right_t}",
-                                f"# {right_t} = (float) {right_t}",
-                            ]
-                        )
-
-                    return [
-                        out,
-                        f"f{self.operator} {out_t}, {left_t}, {right_t}",
-                        f"# {out_t} = {left_t} {self.operator} {right_t}",
-                    ]
+                    if left_type is BuiltInTypeRecordCollection.INT:
+                        sink.emit(f"itof {left_t}, {left_t}")
+                        if EMIT_COMMENTS:
+                            emit_comment(sink, f"{left_t} = (float) {left_t}")
+                    if right_type is BuiltInTypeRecordCollection.INT:
+                        sink.emit(f"itof {right_t}, {right_t}")
+                        if EMIT_COMMENTS:
+                            emit_comment(sink, f"{right_t} = (float) {right_t}")
+
+                    sink.emit(f"f{operator} {out_t}, {left_t}, {right_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(sink, f"{out_t} = {left_t} {operator} {right_t}")
+                return
             case "and":
                 # we can use multiplication to mimic and
                 # 0 * 0 = 0
                 # 0 * 1 = 0
                 # 1 * 0 = 0
                 # 1 * 1 = 1
-                return [
-                    out,
-                    f"imul {out_t}, {left_t}, {right_t}",
-                    f"# {out_t} = {left_t} AND {right_t}",
-                ]
+                sink.emit(f"imul {out_t}, {left_t}, {right_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(sink, f"{out_t} = {left_t} AND {right_t}")
+                return
             case "or":
                 # we can use addition to mimic or
                 # 0 + 0 = 0
@@ -730,54 +991,38 @@ class BinaryExpressionRecord(ExpressionRecord):
                 # 1 + 1 = 2
                 # however, if both are true, the result is 2 (invalid boolean value)
 
-                zero_t = GlobalTemporaryRegisterGenerator.next()
-                return [
-                    out,
-                    f"iadd {out_t}, {left_t}, {right_t}",
-                    f"# {out_t} = {left_t} + {right_t}" f"move_immed_i {zero_t}, 0",
-                    f"# {zero_t} = 0",
-                    f"igt {out_t}, {out_t}, {zero_t}",
-                    f"# {out_t} = {left_t} OR {right_t}",
-                ]
+                sink.emit(f"iadd {out_t}, {left_t}, {right_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(sink, f"{out_t} = {left_t} + {right_t}")
+                zero_t = const_tmp(sink, "move_immed_i", 0)
+                sink.emit(f"igt {out_t}, {out_t}, {zero_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(sink, f"{out_t} = {left_t} OR {right_t}")
+                return
             case "lt" | "leq" | "gt" | "geq":
-                if self.left.type == self.right.type:
+                if left_type == right_type:
                     # both operands are either INT or FLOAT
-                    if self.left.type == BuiltInTypeRecordCollection.INT:
-                        return [
-                            out,
-                            f"i{self.operator} {out_t}, {left_t}, {right_t}",
-                            f"# {out_t} = {left_t} {self.operator} {right_t}",
-                        ]
+                    if left_type is BuiltInTypeRecordCollection.INT:
+                        sink.emit(f"i{operator} {out_t}, {left_t}, {right_t}")
                     else:
-                        return [
-                            out,
-                            f"f{self.operator} {out_t}, {left_t}, {right_t}",
-                            f"# {out_t} = {left_t} {self.operator} {right_t}",
-                        ]
+                        sink.emit(f"f{operator} {out_t}, {left_t}, {right_t}")
                 else:
                     # one or both operands are FLOAT
 
                     # if an operand is INT, we need an extra instruction for casting
-                    if self.left.type == BuiltInTypeRecordCollection.INT:
-                        out.append(
-                            [
-                                f"itof {left_t}, {left_t}",
-                                f"# {left_t} = (float) {left_t}",
-                            ]
-                        )
-                    if self.right.type == BuiltInTypeRecordCollection.INT:
-                        out.append(
-                            [
-                                f"itof {right_t}, {right_t}",
-                                f"# {right_t} = (float) {right_t}",
-                            ]
-                        )
-
-                    return [
-                        out,
-                        f"f{self.operator} {out_t}, {left_t}, {right_t}",
-                        f"# {out_t} = {left_t} {self.operator} {right_t}",
-                    ]
+                    if left_type is BuiltInTypeRecordCollection.INT:
+                        sink.emit(f"itof {left_t}, {left_t}")
+                        if EMIT_COMMENTS:
+                            emit_comment(sink, f"{left_t} = (float) {left_t}")
+                    if right_type is BuiltInTypeRecordCollection.INT:
+                        sink.emit(f"itof {right_t}, {right_t}")
+                        if EMIT_COMMENTS:
+                            emit_comment(sink, f"{right_t} = (float) {right_t}")
+
+                    sink.emit(f"f{operator} {out_t}, {left_t}, {right_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(sink, f"{out_t} = {left_t} {operator} {right_t}")
+                return
             case "eq" | "neq":
                 # we know from type checking that one of the operand is a subtype of the other
                 # we assume left is subtype of right
@@ -788,78 +1033,45 @@ class BinaryExpressionRecord(ExpressionRecord):
                     a, b = b, a
                 # NOTE: since there is a swap, we cannot trust left_t and right_t anymore
 
-                # register to store a < b
-                less_comp_t = GlobalTemporaryRegisterGenerator.next()
-
-                # register to store a > b
-                more_comp_t = GlobalTemporaryRegisterGenerator.next()
-
-                # compute the values of t1 and t2
                 a_t = a.get_value_register()
                 b_t = b.get_value_register()
-                if b.type == BuiltInTypeRecordCollection.FLOAT:
+                if b.type is BuiltInTypeRecordCollection.FLOAT:
                     # [a] can be an INT, so we need to cast if needed
-                    if a.type == BuiltInTypeRecordCollection.INT:
-                        out.append(
-                            [
-                                f"itof {a_t}, {a_t}",
-                                f"# {a_t} = (float) {a_t}",
-                            ]
-                        )
-                    out.append(
-                        [
-                            f"flt {less_comp_t}, {a_t}, {b_t}",
-                            f"# {less_comp_t} = {a_t} < {b_t}",
-                            f"fgt {more_comp_t}, {a_t}, {b_t}",
-                            f"# {more_comp_t} = {a_t} > {b_t}",
-                        ]
-                    )
+                    if a.type is BuiltInTypeRecordCollection.INT:
+                        sink.emit(f"itof {a_t}, {a_t}")
+                        if EMIT_COMMENTS:
+                            emit_comment(sink, f"{a_t} = (float) {a_t}")
+                    prefix = "f"
                 else:
                     # both operands are INT or addresses (so technically INT)
-                    out.append(
-                        [
-                            f"ilt {less_comp_t}, {a_t}, {b_t}",
-                            f"# {less_comp_t} = {a_t} < {b_t}",
-                            f"igt {more_comp_t}, {a_t}, {b_t}",
-                            f"# {more_comp_t} = {a_t} > {b_t}",
-                        ]
-                    )
-
-                # compute (t1 or t2) to determine !=
-                zero_t = GlobalTemporaryRegisterGenerator.next()
-                out.append(
-                    [
-                        f"iadd {out_t}, {less_comp_t}, {more_comp_t}",
-                        f"# {out_t} = {less_comp_t} + {more_comp_t}"
-                        f"move_immed_i {zero_t}, 0",
-                        f"# {zero_t} = 0",
-                        f"igt {out_t}, {out_t}, {zero_t}",
-                        f"# {out_t} = {less_comp_t} OR {more_comp_t}"
-                        f"# {out_t} = {a_t} != {b_t}",
-                    ]
-                )
-
-                if self.operator == "neq":
-                    return out
-
-                # handle eq operator
-                # we need to flip the result of !=
-
-                one_t = GlobalTemporaryRegisterGenerator.next()
-                return [
-                    out,
-                    f"move_immed_i {one_t}, 1",
-                    f"# {one_t} = 1",
-                    f"isub {out_t}, {one_t}, {out_t}",
-                    f"# {out_t} = !{out_t}",
-                    f"# {out_t} = {a_t} == {b_t}",
-                ]
+                    prefix = "i"
+
+                # there is no equality instruction, so we combine two comparisons
+                if operator == "neq":
+                    # a != b when exactly one of a < b or a > b holds (they can never both hold)
+                    #   so their sum is already a valid boolean value
+                    sink.emit(f"{prefix}lt {comp_t}, {a_t}, {b_t}")
+                    sink.emit(f"{prefix}gt {out_t}, {a_t}, {b_t}")
+                    sink.emit(f"iadd {out_t}, {out_t}, {comp_t}")
+                    if EMIT_COMMENTS:
+                        emit_comment(sink, f"{out_t} = {a_t} != {b_t}")
+                    return
+
+                # a == b when both a <= b and a >= b hold
+                sink.emit(f"{prefix}leq {comp_t}, {a_t}, {b_t}")
+                sink.emit(f"{prefix}geq {out_t}, {a_t}, {b_t}")
+                sink.emit(f"imul {out_t}, {out_t}, {comp_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(sink, f"{out_t} = {a_t} == {b_t}")
+                return
 
     def __repr__(self):
         return f"Binary({self.operator}, {self.left}, {self.right})"
 
 
 class AssignExpressionRecord(ExpressionRecord):
+    __slots__ = ("left", "right", "value_used")
+
     def __init__(
         self, location: ExprRange, left: "ExpressionRecord", right: "ExpressionRecord"
     ):
@@ -867,45 +1079,67 @@ class AssignExpressionRecord(ExpressionRecord):
         self.left = left
         self.right = right
 
+        # whether anything reads the result of the assignment
+        self.value_used = True
+
+    def discard_value(self):
+        self.value_used = False
+
     def compute_type(self, **context):
         left_type = self.left.resolve_type(**context)
         right_type = self.right.resolve_type(**context)
+        self.effects = (
+            self.left.effects
+            | self.right.effects
+            | (
+                ExpressionRecord.WRITES_HEAP
+                if type(self.left) is FieldAccessExpressionRecord
+                else ExpressionRecord.WRITES_VARIABLES
+            )
+        )
         if DependencyTree.is_subtype(right_type, left_type):
             return right_type
         raise Exception(
             f"assignment at lines {self.location} expected the RHS to be a subtype of LHS"
         )
 
-    def generate_code(self, **context):
-        right_code = self.right.generate_code(**context)
-        right_t = self.right.get_value_register()
+    def read_vars(self):
+        return self.left.read_vars() | self.right.read_vars()
 
-        out_t = GlobalTemporaryRegisterGenerator.next()
-        self.value_reg = out_t
+    def assigned_vars(self):
+        assigned = self.left.assigned_vars() | self.right.assigned_vars()
+        if type(self.left) is VarExpressionRecord:
+            assigned |= 1 << self.left.variable.id
+        return assigned
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        self.right.generate_code(sink, ctx)
+        right_t = self.right.get_value_register()
 
         # NOTE:
         # we already know from type checking that the RHS is a subtype of LHS
         #   unlike Java where the result type is that of LHS, it is the RHS in Decaf
         #   for this reason, this expression's value register should store RHS's register
-
-        out = [
-            right_code,
-            f"move {out_t}, {right_t}",
-            f"# {out_t} = {right_t} ({out_t} is the result of the assignment)",
-        ]
-
-        # out = [right_code]
+        if self.value_used:
+            out_t = next_tmp()
+            self.value_reg = out_t
+            sink.emit(f"move {out_t}, {right_t}")
+            if EMIT_COMMENTS:
+                emit_comment(
+                    sink,
+                    f"{out_t} = {right_t} ({out_t} is the result of the assignment)",
+                )
+        else:
+            # nobody reads the result, so there is no need to keep a copy of RHS around
+            self.value_reg = right_t
 
         # NOTE:
         # however, for the actual assignment, we have to consider casting if dealing with built-in types
-        if self.left.type == BuiltInTypeRecordCollection.FLOAT:
-            if self.right.type == BuiltInTypeRecordCollection.INT:
-                out.append(
-                    [
-                        f"itof {right_t}, {right_t}",
-                        f"# {right_t} = (float) {right_t}",
-                    ]
-                )
+        if self.left.type is BuiltInTypeRecordCollection.FLOAT:
+            if self.right.type is BuiltInTypeRecordCollection.INT:
+                sink.emit(f"itof {right_t}, {right_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(sink, f"{right_t} = (float) {right_t}")
             else:
                 # no need to do casting because RHS type has to be float
                 pass
@@ -914,41 +1148,36 @@ class AssignExpressionRecord(ExpressionRecord):
         # we also need to consider if LHS is field or a regular variable
         #   if regular variable, then we just need to copy RHS's value into LHS's register
         #   if field, then we need to actuall update the heap where the field is located
-        if isinstance(self.left, FieldAccessExpressionRecord):
+        if type(self.left) is FieldAccessExpressionRecord:
             # through type checking, we already know that the base of the access is either an object or class
 
-            offset_t = GlobalTemporaryRegisterGenerator.next()
-            out.append(
-                [
-                    f"move_immed_i {offset_t}, {self.left.field.offset}",
-                    f"# {offset_t} = {self.left.field.offset}",
-                ]
-            )
+            offset_t = const_tmp(sink, "move_immed_i", self.left.field.offset)
 
-            if isinstance(self.left.base.type, ClassLiteralTypeRecord):
+            if self.left.is_static:
                 # if base is a class, we don't need to compute any base address
                 # we can just rely on the field to determine where to store
-                return [
-                    out,
-                    f"hstore sap, {offset_t}, {right_t}",
-                    f"# {self.left.base.type.type}.{self.left.name} = {right_t}",
-                ]
+                sink.emit(f"hstore sap, {offset_t}, {right_t}")
+                if EMIT_COMMENTS:
+                    emit_comment(
+                        sink, f"{self.left.base.type.type}.{self.left.name} = {right_t}"
+                    )
+                return
 
             # we now know that the base is an object
             # we need to run the code of the base to determine the base address
-            base_code = self.left.base.generate_code(**context)
+            self.left.base.generate_code(sink, ctx)
             base_t = self.left.base.get_value_register()
-            return [
-                out,
-                base_code,
-                f"hstore {base_t}, {offset_t}, {right_t}",
-                f"# {base_t}.{self.left.name} = {right_t}",
-            ]
+            sink.emit(f"hstore {base_t}, {offset_t}, {right_t}")
+            if EMIT_COMMENTS:
+                emit_comment(sink, f"{base_t}.{self.left.name} = {right_t}")
+            return
 
         # handle regular variable LHS case
-        left_code = self.left.generate_code(**context)
+        self.left.generate_code(sink, ctx)
         left_t = self.left.get_value_register()
-        return [out, left_code, f"move {left_t}, {right_t}", f"# {left_t} = {right_t}"]
+        sink.emit(f"move {left_t}, {right_t}")
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"{left_t} = {right_t}")
 
     def __repr__(self):
         return f"Assign({self.left}, {self.right}, {self.left.type}, {self.right.type})"
@@ -956,6 +1185,8 @@ class AssignExpressionRecord(ExpressionRecord):
 
 # TODO
 class AutoExpressionRecord(ExpressionRecord):
+    __slots__ = ("expr", "operation", "position", "value_used")
+
     def __init__(
         self,
         location: ExprRange,
@@ -968,8 +1199,27 @@ class AutoExpressionRecord(ExpressionRecord):
         self.operation = operation
         self.position = position
 
+        # whether anything reads the result of the expression
+        self.value_used = True
+
+    def discard_value(self):
+        self.value_used = False
+
+    # (operand type, operation) => (instruction, constant load instruction, constant)
+    STEPS: Dict[Tuple["TypeRecord", str], Tuple[str, str, Union[int, float]]] = {
+        (BuiltInTypeRecordCollection.INT, "inc"): ("iadd", "move_immed_i", 1),
+        (BuiltInTypeRecordCollection.INT, "dec"): ("isub", "move_immed_i", 1),
+        (BuiltInTypeRecordCollection.FLOAT, "inc"): ("fadd", "move_immed_f", 1.0),
+        (BuiltInTypeRecordCollection.FLOAT, "dec"): ("fsub", "move_immed_f", 1.0),
+    }
+
     def compute_type(self, **context):
         expr_type = self.expr.resolve_type(**context)
+        self.effects = self.expr.effects | (
+            ExpressionRecord.WRITES_HEAP
+            if type(self.expr) is FieldAccessExpressionRecord
+            else ExpressionRecord.WRITES_VARIABLES
+        )
         if expr_type in (
             BuiltInTypeRecordCollection.INT,
             BuiltInTypeRecordCollection.FLOAT,
@@ -979,76 +1229,54 @@ class AutoExpressionRecord(ExpressionRecord):
             f"auto expression expected inner expression to be an integer or float at lines {self.location}"
         )
 
-    def generate_code(self, **context):
-        expr_code = self.expr.generate_code(**context)
-        expr_t = self.expr.get_value_register()
+    def read_vars(self):
+        return self.expr.read_vars()
 
-        out = [expr_code]
+    def assigned_vars(self):
+        assigned = self.expr.assigned_vars()
+        if type(self.expr) is VarExpressionRecord:
+            assigned |= 1 << self.expr.variable.id
+        return assigned
 
-        # compute new value
-        one_t = GlobalTemporaryRegisterGenerator.next()
-        new_value_t = GlobalTemporaryRegisterGenerator.next()
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        self.expr.generate_code(sink, ctx)
+        expr_t = self.expr.get_value_register()
 
-        out_t = GlobalTemporaryRegisterGenerator.next()
-        self.value_reg = out_t
-        if self.expr.type == BuiltInTypeRecordCollection.INT:
-            out.append([f"move_immed_i {one_t}, 1", f"# {one_t} = 1"])
-            if self.operation == "inc":
-                out.append(
-                    [
-                        f"iadd {new_value_t}, {expr_t}, {one_t}",
-                        f"# {new_value_t} = {expr_t} add {one_t}",
-                    ]
-                )
-            else:
-                out.append(
-                    [
-                        f"isub {new_value_t}, {expr_t}, {one_t}",
-                        f"# {new_value_t} = {expr_t} sub {one_t}",
-                    ]
-                )
+        # compute new value
+        if self.value_used:
+            new_value_t, out_t = next_tmps(2)
         else:
-            out.append([f"move_immed_f {one_t}, 1.0", f"# {one_t} = 1.0"])
-            if self.operation == "inc":
-                out.append(
-                    [
-                        f"fadd {new_value_t}, {expr_t}, {one_t}",
-                        f"# {new_value_t} = {expr_t} add {one_t}",
-                    ]
-                )
-            else:
-                out.append(
-                    [
-                        f"fsub {new_value_t}, {expr_t}, {one_t}",
-                        f"# {new_value_t} = {expr_t} sub {one_t}",
-                    ]
-                )
+            # nobody reads the result, so the new value doubles as it
+            new_value_t = out_t = next_tmp()
+        self.value_reg = out_t
+        op, const_op, one = AutoExpressionRecord.STEPS[
+            (self.expr.type, self.operation)
+        ]
+        one_t = const_tmp(sink, const_op, one)
+        sink.emit(f"{op} {new_value_t}, {expr_t}, {one_t}")
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"{new_value_t} = {expr_t} {op[1:]} {one_t}")
 
         # store the correct value into THIS expression's register
-
-        if self.position == "pre":
-            out.append([f"move {out_t}, {new_value_t}", f"# {out_t} = {new_value_t}"])
-        else:
-            out.append([f"move {out_t}, {expr_t}", f"# {out_t} = {new_value_t}"])
+        if self.value_used:
+            result_t = new_value_t if self.position == "pre" else expr_t
+            sink.emit(f"move {out_t}, {result_t}")
+            if EMIT_COMMENTS:
+                emit_comment(sink, f"{out_t} = {result_t}")
 
         # NOTE:
         # we now also need to update the register of the old expression with the new value
 
-        if isinstance(self.expr, FieldAccessExpressionRecord):
+        if type(self.expr) is FieldAccessExpressionRecord:
             # if the old expression is a field access, we need to update the heap
 
-            offset_t = GlobalTemporaryRegisterGenerator.next()
-            out.append(
-                [
-                    f"move_immed_i {offset_t}, {self.expr.field.offset}",
-                    f"# {offset_t} = {self.expr.field.offset}",
-                ]
-            )
+            offset_t = const_tmp(sink, "move_immed_i", self.expr.field.offset)
 
-            if isinstance(self.expr.base.type, ClassLiteralTypeRecord):
+            if self.expr.is_static:
                 # if base is a class, we don't need to compute any base address
                 # we can just rely on the field to determine where to store
-                return [out, f"hstore sap, {offset_t}, {new_value_t}"]
+                sink.emit(f"hstore sap, {offset_t}, {new_value_t}")
+                return
 
             # we now know that the base is an object
             # we need to run the code of the base to determine the base address
@@ -1058,16 +1286,21 @@ class AutoExpressionRecord(ExpressionRecord):
             #   doing so already generated the code for the base as well
             #   which means we can just use the assigned register directly
             base_t = self.expr.base.get_value_register()
-            return [out, f"hstore {base_t}, {offset_t}, {new_value_t}"]
+            sink.emit(f"hstore {base_t}, {offset_t}, {new_value_t}")
+            return
 
         # we now know we don't have to update heap
-        return [out, f"move {expr_t}, {new_value_t}", f"# {expr_t} = {new_value_t}"]
+        sink.emit(f"move {expr_t}, {new_value_t}")
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"{expr_t} = {new_value_t}")
 
     def __repr__(self):
         return f"Auto({self.expr}, {self.operation}, {self.position})"
 
 
 class FieldAccessExpressionRecord(ExpressionRecord):
+    __slots__ = ("base", "name", "containing_class", "field", "is_static")
+
     def __init__(
         self,
         location: ExprRange,
@@ -1083,14 +1316,21 @@ class FieldAccessExpressionRecord(ExpressionRecord):
         # set this during type resolving
         self.field: "FieldRecord" = None
 
+        # whether the base is a class (static field) rather than an object (set during type resolving)
+        #   code generation branches on this instead of re-inspecting the base type
+        self.is_static: bool = None
+
     def compute_type(self, **context):
         base_type = self.base.resolve_type(**context)
+        self.effects = self.base.effects | ExpressionRecord.READS_HEAP
 
         field = None
-        if isinstance(base_type, UserTypeRecord):
+        if type(base_type) is UserTypeRecord:
             field = DependencyTree.resolve_field(base_type.type, self.name, False)
-        elif isinstance(base_type, ClassLiteralTypeRecord):
+            self.is_static = False
+        elif type(base_type) is ClassLiteralTypeRecord:
             field = DependencyTree.resolve_field(base_type.type, self.name, True)
+            self.is_static = True
 
         if field == None:
             raise Exception(
@@ -1098,7 +1338,7 @@ class FieldAccessExpressionRecord(ExpressionRecord):
             )
 
         if (
-            field.visibility == "private"
+            field.visibility is PRIVATE
             and field.containing_class != self.containing_class
         ):
             raise Exception(
@@ -1108,35 +1348,47 @@ class FieldAccessExpressionRecord(ExpressionRecord):
         self.field = field
         return field.type
 
-    def generate_code(self, **context):
+    def read_vars(self):
+        return self.base.read_vars()
+
+    def assigned_vars(self):
+        return self.base.assigned_vars()
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         """
         NOTE: this should only be used if you want to generate code that will help you get the actual field value
         """
-        out_t = GlobalTemporaryRegisterGenerator.next()
+        out_t = next_tmp()
         self.value_reg = out_t
 
-        offset_t = GlobalTemporaryRegisterGenerator.next()
-        out = [
-            f"move_immed_i {offset_t}, {self.field.offset}",
-            f"# {offset_t} = {self.field.offset}",
-        ]
+        offset_t = const_tmp(sink, "move_immed_i", self.field.offset)
 
-        if isinstance(self.base.type, ClassLiteralTypeRecord):
+        if self.is_static:
             # if base is a class, we don't need to compute any base address
             # we can just rely on the field to determine where to store
-            return [out, f"hload {out_t}, sap, {offset_t}"]
+            sink.emit(f"hload {out_t}, sap, {offset_t}")
+            return
 
         # we now know that the base is an object
         # we need to run the code of the base to determine the base address
-        base_code = self.base.generate_code(**context)
+        self.base.generate_code(sink, ctx)
         base_t = self.base.get_value_register()
-        return [out, base_code, f"hload {out_t}, {base_t}, {offset_t}"]
+        sink.emit(f"hload {out_t}, {base_t}, {offset_t}")
 
     def __repr__(self):
         return f"Field-access({self.base}, {self.name}, {self.field.id})"
 
 
 class MethodCallExpressionRecord(ExpressionRecord):
+    __slots__ = (
+        "base",
+        "name",
+        "arguments",
+        "containing_class",
+        "method",
+        "casts_to_float",
+    )
+
     def __init__(
         self,
         location: ExprRange,
@@ -1154,14 +1406,25 @@ class MethodCallExpressionRecord(ExpressionRecord):
         # set this during type resolving
         self.method: Optional["MethodRecord"] = None
 
+        # whether each argument is an INT passed to a FLOAT parameter (set during type resolving)
+        self.casts_to_float: List[bool] = None
+
     def compute_type(self, **context):
         base_type = self.base.resolve_type(**context)
 
+        # the callee can do anything to the heap, but it cannot touch our variables
+        self.effects = (
+            self.base.effects
+            | ExpressionRecord.CALLS
+            | ExpressionRecord.READS_HEAP
+            | ExpressionRecord.WRITES_HEAP
+        )
+
         # determine the method being referenced using name resolution
         method = None
-        if isinstance(base_type, UserTypeRecord):
+        if type(base_type) is UserTypeRecord:
             method = DependencyTree.resolve_method(base_type.type, self.name, False)
-        elif isinstance(base_type, ClassLiteralTypeRecord):
+        elif type(base_type) is ClassLiteralTypeRecord:
             method = DependencyTree.resolve_method(base_type.type, self.name, True)
 
         # determine the type of this expression from reference
@@ -1171,7 +1434,7 @@ class MethodCallExpressionRecord(ExpressionRecord):
             )
 
         if (
-            method.visibility == "private"
+            method.visibility is PRIVATE
             and method.containing_class != self.containing_class
         ):
             raise Exception(
@@ -1185,121 +1448,129 @@ class MethodCallExpressionRecord(ExpressionRecord):
 
         for i, (p, a) in enumerate(zip(method.parameters, self.arguments)):
             a_type = a.resolve_type(**context)
-            if not DependencyTree.is_subtype(a_type, p.type):
+            self.effects |= a.effects
+            # identical types (e.g. an int passed to an int) need no subtype check
+            if a_type is not p.type and not DependencyTree.is_subtype(a_type, p.type):
                 raise Exception(
                     f"found method call for `{self.name}`, but the argument at index {i} is incompatible at lines {a.location}"
                 )
 
         self.method = method
+        float_type = BuiltInTypeRecordCollection.FLOAT
+        int_type = BuiltInTypeRecordCollection.INT
+        self.casts_to_float = [
+            p.type is float_type and a.type is int_type
+            for p, a in zip(method.parameters, self.arguments)
+        ]
         return method.return_type
 
-    def generate_code(self, **context):
-        out = []
+    def read_vars(self):
+        read = self.base.read_vars()
+        for arg in self.arguments:
+            read |= arg.read_vars()
+        return read
+
+    def assigned_vars(self):
+        assigned = self.base.assigned_vars()
+        for arg in self.arguments:
+            assigned |= arg.assigned_vars()
+        return assigned
 
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # NOTE: before we start evaluating the expressions
         #   we need to understand that the registers created after this point does not need to be saved
         #       this is because they will be copied to a0 ... a_m where m is the number of arguments needed for calling the method
         #   for this reason, we can reset the temporary generator to the point BEFORE the procedure call
         #       so that we can re-use all those temporary registers used while evaluating expressions AFTER procedure call
-        seed = GlobalTemporaryRegisterGenerator.get_curr()
+        seed = cur_tmp()
 
         # from type checking, we already know that each argument is a subtype of its corresponding parameter
         # thus, we need to handle casting of ints to floats, if necessary
         # everything else does not need casting
-        for p, a in zip(self.method.parameters, self.arguments):
-            out.append(a.generate_code(**context))
-            if (
-                p.type == BuiltInTypeRecordCollection.FLOAT
-                and a.type == BuiltInTypeRecordCollection.INT
-            ):
+        # NOTE: which arguments need the cast is already decided during type checking
+        for a, needs_cast in zip(self.arguments, self.casts_to_float):
+            a.generate_code(sink, ctx)
+            if needs_cast:
                 arg_t = a.get_value_register()
-                out.append(f"itof {arg_t}, {arg_t}")
+                sink.emit(f"itof {arg_t}, {arg_t}")
 
         # we now have every argument computed and casted
 
         # we now need to save every $a register we are about to modify
-        saved_regs: List[str] = []
-
+        #   followed by all temporary registers that have been used
+        # both ranges start at 0, so each is generated in one go
         a_needed = len(self.method.parameters)
-        if self.method.applicability == "instance":
+        if self.method.applicability is INSTANCE:
             a_needed += 1
-        arg_gen = ArgumentRegisterGenerator()
-        while a_needed > 0:
-            arg_a = arg_gen.next()
-            saved_regs.append(arg_a)
-            out.append(f"save {arg_a}")
-            a_needed -= 1
-
-        # we then need to save all temporary registers that have been used
-        t_needed = seed
-        temp_gen = TemporaryRegisterGenerator()
-        while t_needed > 0:
-            temp_t = temp_gen.next()
-            saved_regs.append(temp_t)
-            out.append(f"save {temp_t}")
-            t_needed -= 1
+        arg_regs = ArgumentRegisterGenerator().next_many(a_needed)
+        saved_regs: List[str] = arg_regs + TemporaryRegisterGenerator().next_many(seed)
+        for reg in saved_regs:
+            sink.emit(f"save {reg}")
 
         # we now need to transfer the contents of the relevant registers into argument registers
-        arg_gen = ArgumentRegisterGenerator()
+        #   the argument registers are the ones we just saved, in the same order
+        # NOTE: values may already live in argument registers (parameters, this), so the moves are emitted together
+        moves: List[Tuple[str, str]] = []
+        pass_regs = arg_regs
 
         # if this method is not static, then $a0 is dedicated to holding a value of the base object address
-        if self.method.applicability == "instance":
-            base_a = arg_gen.next()
-            base_code = self.base.generate_code(**context)
-            base_t = self.base.get_value_register()
-            out.append(
-                [base_code, f"move {base_a}, {base_t}", f"# {base_a} = {base_t}"]
-            )
+        if self.method.applicability is INSTANCE:
+            pass_regs = arg_regs[1:]
+            self.base.generate_code(sink, ctx)
+            moves.append((arg_regs[0], self.base.get_value_register()))
         else:
             # if the method is static, then we don't need to generate any code for the base
             # the method reference alone gives us enough information
             pass
 
         # copy over the rest of arguments
-        for a in self.arguments:
-            pass_a = arg_gen.next()
-            arg_t = a.get_value_register()
-            out.append([f"move {pass_a}, {arg_t}", f"# {pass_a} = {arg_t}"])
+        for pass_a, a in zip(pass_regs, self.arguments):
+            moves.append((pass_a, a.get_value_register()))
+        emit_moves(sink, moves)
 
         # we now need to call the method
         method_l = self.method.get_label()
-        out.append(f"call {method_l}")
+        sink.emit(f"call {method_l}")
 
         # methods can return stuff in $a0, so we need to store it before restoring
 
         # NOTE: as mentioned earlier, we used more temporaries to compute the arguments before calling the procedure
         #   after the procedure call, those temporaries are obsolutely useless, so we can rest the generator to reuse them
-        GlobalTemporaryRegisterGenerator.reset(seed)
-        out_t = GlobalTemporaryRegisterGenerator.next()
+        reset_tmp(seed)
+        out_t = next_tmp()
         self.value_reg = out_t
 
-        if self.method.return_type == BuiltInTypeRecordCollection.VOID:
+        if self.method.return_type is BuiltInTypeRecordCollection.VOID:
             # if the method returns void, then we don't need to expect anything inside $a0
             # we will just use a default 0 value
-            out.append([f"move_immed_i {out_t}, 0", f"# {out_t} = 0"])
+            sink.emit(f"move_immed_i {out_t}, 0")
+            if EMIT_COMMENTS:
+                emit_comment(sink, f"{out_t} = 0")
         else:
             # the method returns non-void and we need to capture that
-            out.append([f"move {out_t}, a0", f"# {out_t} = a0"])
+            sink.emit(f"move {out_t}, a0")
+            if EMIT_COMMENTS:
+                emit_comment(sink, f"{out_t} = a0")
 
         # we now to restore all registers that were previously active before procedure call
         # NOTE: the registers need to be restored in reverse because they were pushed onto the stack
         for reg in reversed(saved_regs):
-            out.append(f"restore {reg}")
-
-        return out
+            sink.emit(f"restore {reg}")
 
     def __repr__(self):
         args = ", ".join(map(repr, self.arguments))
-        return ", ".join(
-            [
-                f"Method-call({self.base}",
-                f"{self.name}",
-                f"[{args}])",
-            ]
-        )
+        return f"Method-call({self.base}, {self.name}, [{args}])"
 
 
 class NewObjectExpressionRecord(ExpressionRecord):
+    __slots__ = (
+        "class_name",
+        "arguments",
+        "containing_class",
+        "constructor",
+        "casts_to_float",
+    )
+
     def __init__(
         self,
         location: ExprRange,
@@ -1315,7 +1586,17 @@ class NewObjectExpressionRecord(ExpressionRecord):
         # set this during type resolving
         self.constructor: "ConstructorRecord" = None
 
+        # whether each argument is an INT passed to a FLOAT parameter (set during type resolving)
+        self.casts_to_float: List[bool] = None
+
     def compute_type(self, **context):
+        # the constructor can do anything to the heap, but it cannot touch our variables
+        self.effects = (
+            ExpressionRecord.CALLS
+            | ExpressionRecord.READS_HEAP
+            | ExpressionRecord.WRITES_HEAP
+        )
+
         rec = DependencyTree.get_class_record(self.class_name)
         if rec == None:
             raise Exception(
@@ -1330,7 +1611,7 @@ class NewObjectExpressionRecord(ExpressionRecord):
         # due to A04 constrainsts, there will always be <= 1 constructor
         cons = rec.constructors[0]
         if (
-            cons.visibility == "private"
+            cons.visibility is PRIVATE
             and cons.containing_class != self.containing_class
         ):
             raise Exception(
@@ -1344,131 +1625,132 @@ class NewObjectExpressionRecord(ExpressionRecord):
 
         for i, (p, a) in enumerate(zip(cons.parameters, self.arguments)):
             a_type = a.resolve_type(**context)
-            if not DependencyTree.is_subtype(a_type, p.type):
+            self.effects |= a.effects
+            # identical types (e.g. an int passed to an int) need no subtype check
+            if a_type is not p.type and not DependencyTree.is_subtype(a_type, p.type):
                 raise Exception(
                     f"found constructor, but the argument at index {i} is incompatible at lines {a.location}"
                 )
 
         self.constructor = cons
+        float_type = BuiltInTypeRecordCollection.FLOAT
+        int_type = BuiltInTypeRecordCollection.INT
+        self.casts_to_float = [
+            p.type is float_type and a.type is int_type
+            for p, a in zip(cons.parameters, self.arguments)
+        ]
         return UserTypeRecord(self.class_name)
 
-    def generate_code(self, **context):
-        out_t = GlobalTemporaryRegisterGenerator.next()
-        self.value_reg = out_t
+    def read_vars(self):
+        read = 0
+        for arg in self.arguments:
+            read |= arg.read_vars()
+        return read
+
+    def assigned_vars(self):
+        assigned = 0
+        for arg in self.arguments:
+            assigned |= arg.assigned_vars()
+        return assigned
 
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         class_rec = DependencyTree.get_class_record(self.constructor.containing_class)
         if class_rec == None:
             raise Exception(
                 f"illegal program state - expected class record for `{self.constructor.containing_class}` to be defined"
             )
 
-        # generate code for allocating space for new object
-        out = [f"halloc {out_t}, {class_rec.size}"]
-
         # NOTE: before we start evaluating the expressions
         #   we need to understand that the registers created after this point does not need to be saved
         #       this is because they will be copied to a0 ... a_m where m is the number of arguments needed for calling the method
         #   for this reason, we can reset the temporary generator to the point BEFORE the procedure call
         #       so that we can re-use all those temporary registers used while evaluating expressions AFTER procedure call
-        seed = GlobalTemporaryRegisterGenerator.get_curr()
+        seed = cur_tmp()
 
         # from type checking, we already know that each argument is a subtype of its corresponding parameter
         # thus, we need to handle casting of ints to floats, if necessary
         # everything else does not need casting
-        for p, a in zip(self.constructor.parameters, self.arguments):
-            out.append(a.generate_code(**context))
-            if (
-                p.type == BuiltInTypeRecordCollection.FLOAT
-                and a.type == BuiltInTypeRecordCollection.INT
-            ):
+        # NOTE: which arguments need the cast is already decided during type checking
+        for a, needs_cast in zip(self.arguments, self.casts_to_float):
+            a.generate_code(sink, ctx)
+            if needs_cast:
                 arg_t = a.get_value_register()
-                out.append(f"itof {arg_t}, {arg_t}")
-
-        # we now have the base address and every argument computed and casted
-        saved_regs: List[str] = []
+                sink.emit(f"itof {arg_t}, {arg_t}")
 
+        # we now have every argument computed and casted
+        # we need to save every $a register we are about to modify, followed by all temporary registers that have been used
+        # both ranges start at 0, so each is generated in one go
         a_needed = (
             len(self.constructor.parameters) + 1
         )  # +1 for the base address in $a0
-        arg_gen = ArgumentRegisterGenerator()
-        while a_needed > 0:
-            arg_a = arg_gen.next()
-            saved_regs.append(arg_a)
-            out.append(f"save {arg_a}")
-            a_needed -= 1
-
-        # we now need to save all temporary registers that have been used
-        t_needed = seed
-        temp_gen = TemporaryRegisterGenerator()
-        while t_needed > 0:
-            temp_t = temp_gen.next()
-            saved_regs.append(temp_t)
-            out.append(f"save {temp_t}")
-            t_needed -= 1
+        arg_regs = ArgumentRegisterGenerator().next_many(a_needed)
+        saved_regs: List[str] = arg_regs + TemporaryRegisterGenerator().next_many(seed)
+        for reg in saved_regs:
+            sink.emit(f"save {reg}")
 
         # we now need to transfer the contents of the relevant registers into argument registers
-        # we use our own generator because we need to start at a0
-        #   we also don't want to mark these as active registers
-        arg_gen = ArgumentRegisterGenerator()
+        #   the argument registers are the ones we just saved, in the same order
+        # NOTE: values may already live in argument registers (parameters, this), so the moves are emitted together
 
-        # copy over base address into $a0
-        base_t = arg_gen.next()
-        out.append([f"move {base_t}, {out_t}", f"# {base_t} = {out_t}"])
+        moves: List[Tuple[str, str]] = []
+        for pass_t, a in zip(arg_regs[1:], self.arguments):
+            moves.append((pass_t, a.get_value_register()))
+        emit_moves(sink, moves)
 
-        # copy over the rest of arguments
-        for a in self.arguments:
-            pass_t = arg_gen.next()
-            arg_t = a.get_value_register()
-            out.append([f"move {pass_t}, {arg_t}", f"# {pass_t} = {arg_t}"])
+        # allocate space for the new object straight into $a0, which is where the constructor expects it
+        #   this can only happen now, because the arguments above may still read the old $a0
+        base_a = arg_regs[0]
+        sink.emit(f"halloc {base_a}, {class_rec.size}")
 
         # we now need to call the constructor
         con_l = self.constructor.get_label()
-        out.append(f"call {con_l}")
+        sink.emit(f"call {con_l}")
 
         # NOTE: as mentioned earlier, we used more temporaries to compute the arguments before calling the procedure
         #   after the procedure call, those temporaries are obsolutely useless, so we can rest the generator to reuse them
-        GlobalTemporaryRegisterGenerator.reset(seed)
+        reset_tmp(seed)
+
+        # the constructor leaves the object address in $a0, so it is copied out before $a0 is restored
+        #   the new register comes after every saved temporary, so the restores below do not touch it
+        out_t = next_tmp()
+        self.value_reg = out_t
+        sink.emit(f"move {out_t}, {base_a}")
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"{out_t} = {base_a}")
 
-        # we don't expect anything to return from the constructor so we just restore the registers
         # NOTE: the registers need to be restored in reverse because they were pushed onto the stack
         for reg in reversed(saved_regs):
-            out.append(f"restore {reg}")
-
-        return out
+            sink.emit(f"restore {reg}")
 
     def __repr__(self):
         args = ", ".join(map(repr, self.arguments))
-        return ", ".join(
-            [
-                f"New-object({self.class_name}",
-                f"[{args}])",
-            ]
-        )
+        return f"New-object({self.class_name}, [{args}])"
 
 
 class ThisExpressionRecord(ExpressionRecord):
+    __slots__ = ()
+
     def __init__(self, location: ExprRange, containing_class: str):
         super().__init__(location, UserTypeRecord(containing_class))
 
-    def generate_code(self, **context):
-        self_t: Optional[str] = context["self_t"]
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        self_t = ctx.self_t
         if self_t == None:
             raise Exception(
                 "expected caller to provide a register that stores address of current object"
             )
 
-        # even though we are just using the register passed through context
-        #   we need to make sure that this register cannot be modified no matter what
-        #   so we just make a copy
-        out_t = GlobalTemporaryRegisterGenerator.next()
-        self.value_reg = out_t
-        return [f"move {out_t}, {self_t}", f"# {out_t} = {self_t}"]
+        # the register passed through ctx is never written to (this cannot be assigned)
+        #   so we can use it directly instead of making a copy
+        self.value_reg = self_t
 
     def __repr__(self):
         return "This"
 
 
 class SuperExpressionRecord(ExpressionRecord):
+    __slots__ = ("containing_class",)
+
     def __init__(self, location: ExprRange, containing_class: str):
         # even though we know the current class name, we do not know if its super class record exists
         super().__init__(location, None)
@@ -1494,29 +1776,28 @@ class SuperExpressionRecord(ExpressionRecord):
 
         return UserTypeRecord(rec.name)
 
-    def generate_code(self, **context):
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # NOTE: this is the same implementation as that of ThisExpressionRecord
         #   the reason is that the base object address being referred by "super" is no different from that of "this"
         #   the super is just here to help us identify what access level we have during type-checking
 
-        self_t: Optional[str] = context["self_t"]
+        self_t = ctx.self_t
         if self_t == None:
             raise Exception(
                 "expected caller to provide a register that stores address of current object"
             )
 
-        # even though we are just using the register passed through context
-        #   we need to make sure that this register cannot be modified no matter what
-        #   so we just make a copy
-        out_t = GlobalTemporaryRegisterGenerator.next()
-        self.value_reg = out_t
-        return [f"move {out_t}, {self_t}", f"# {out_t} = {self_t}"]
+        # the register passed through ctx is never written to (this cannot be assigned)
+        #   so we can use it directly instead of making a copy
+        self.value_reg = self_t
 
     def __repr__(self):
         return "Super"
 
 
 class ClassReferenceExpressionRecord(ExpressionRecord):
+    __slots__ = ("class_name",)
+
     def __init__(self, location: ExprRange, class_name: str):
         # even though we have the name, we will use None
         # we want to resolve this name during type checking to ensure the name is a valid class name
@@ -1530,18 +1811,28 @@ class ClassReferenceExpressionRecord(ExpressionRecord):
             )
         return ClassLiteralTypeRecord(self.class_name)
 
-    def generate_code(self, **context):
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # because this is a class reference, we don't need any code
         # we also don't need any registers
         # code that depend on this knows to use an offset from the $sap
-        return []
+        pass
 
     def __repr__(self):
         return f"Class-reference({self.class_name})"
 
 
 class FieldRecord:
-    id_gen = Counter(1)
+    __slots__ = (
+        "name",
+        "id",
+        "visibility",
+        "applicability",
+        "type",
+        "containing_class",
+        "offset",
+    )
+
+    id_gen = count(1).__next__
 
     def __init__(
         self,
@@ -1552,7 +1843,7 @@ class FieldRecord:
         containing_class: str,
     ):
         self.name = name
-        self.id = FieldRecord.id_gen.next()
+        self.id = FieldRecord.id_gen()
         self.visibility = visibility
         self.applicability = applicability
         self.type = type
@@ -1565,20 +1856,27 @@ class FieldRecord:
         self.offset: int = None
 
     def __repr__(self):
-        return ", ".join(
-            [
-                f"FIELD {self.id}",
-                f"{self.name}",
-                f"{self.containing_class}",
-                f"{self.visibility}",
-                f"{self.applicability}",
-                f"{self.type}",
-            ]
+        return (
+            f"FIELD {self.id}, {self.name}, {self.containing_class}, "
+            f"{self.visibility}, {self.applicability}, {self.type}"
         )
 
 
 class MethodRecord:
-    id_gen = Counter(1)
+    __slots__ = (
+        "name",
+        "id",
+        "visibility",
+        "applicability",
+        "parameters",
+        "return_type",
+        "body",
+        "variable_table",
+        "containing_class",
+        "label",
+    )
+
+    id_gen = count(1).__next__
 
     def __init__(
         self,
@@ -1592,7 +1890,7 @@ class MethodRecord:
         containing_class: str,
     ):
         self.name = name
-        self.id = MethodRecord.id_gen.next()
+        self.id = MethodRecord.id_gen()
         self.visibility = visibility
         self.applicability = applicability
         self.parameters = parameters
@@ -1601,12 +1899,15 @@ class MethodRecord:
         self.variable_table = variable_table
         self.containing_class = containing_class
 
+        # the name and id never change, so the label is only formatted once
+        self.label = f"M_{self.name}_{self.id}"
+
     def get_label(self) -> str:
-        return f"M_{self.name}_{self.id}"
+        return self.label
 
-    def generate_code(self, **context) -> "NestedStrList":
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # we need fresh pool of registers
-        GlobalTemporaryRegisterGenerator.reset()
+        reset_tmp()
 
         self_l = self.get_label()
 
@@ -1615,7 +1916,7 @@ class MethodRecord:
         # this will store the register for the current object reference if any
         this_a: Optional[str] = None
 
-        if self.applicability == "instance":
+        if self.applicability is INSTANCE:
             this_a = arg_gen.next()
 
         # assign the parameters with argument registers
@@ -1624,45 +1925,44 @@ class MethodRecord:
                 raise Exception("argument somehow got assigned with register already")
             v.value_reg = arg_gen.next()
 
-        # we dont use **{**context, ...} because it is not expected for self_t to be specified in context already
-        #   this_a may be None, but that's ok because static methods will not complain
-        body_code = self.body.generate_code(**context, self_t=this_a)
+        sink.emit(f"{self_l}:")
 
+        # this_a may be None, but that's ok because static methods will not complain
+        ctx.self_t = this_a
         # NOTE: A05 constraints state that methods will always have a return
         #   so we do not need to add a safety ret at the end
-        return [
-            f"{self_l}:",
-            body_code,
-        ]
+        self.body.generate_code(sink, ctx)
 
-    def __repr__(self):
-        header = ", ".join(
-            [
-                str(self.id),
-                f"{self.name}",
-                f"{self.containing_class}",
-                f"{self.visibility}",
-                f"{self.applicability}",
-                repr(self.return_type),
-            ]
-        )
-        params = ", ".join(map(lambda p: str(p.id), self.parameters))
-        return "\n".join(
-            [
-                f"METHOD: {header}",
-                f"Method Parameters: {params}",
-                f"Variable Table:",
-                *map(lambda v: v.get_table_details(), self.variable_table),
-                f"Method Body:",
-                f"{self.body}",
-            ]
+    def write_repr(self, buf: "StringIO"):
+        """
+        Writes the same text as `repr` into `buf`.
+        """
+        header = (
+            f"{self.id}, {self.name}, {self.containing_class}, "
+            f"{self.visibility}, {self.applicability}, {self.return_type!r}"
         )
+        params = ", ".join([str(p.id) for p in self.parameters])
+        buf.write(f"METHOD: {header}\n")
+        buf.write(f"Method Parameters: {params}\n")
+        buf.write("Variable Table:\n")
+        for v in self.variable_table:
+            buf.write(v.get_table_details())
+            buf.write("\n")
+        buf.write("Method Body:\n")
+        buf.write(repr(self.body))
+
+    def __repr__(self):
+        buf = StringIO()
+        self.write_repr(buf)
+        return buf.getvalue()
 
 
 StmtRange = Tuple[int, int]
 
 
-class StatementRecord:
+class StatementRecord(ABC):
+    __slots__ = ("location", "type_correct", "resolved_correctness")
+
     def __init__(self, location: StmtRange):
         self.location = location
 
@@ -1671,11 +1971,12 @@ class StatementRecord:
         self.type_correct = True
         self.resolved_correctness = False
 
+    @abstractmethod
     def compute_type_correct(self, **context) -> bool:
         """
         Override this method to compute your own type correctness.
         """
-        raise Exception("not implemented")
+        pass
 
     def resolve_type_correct(self, **context) -> bool:
         if self.resolved_correctness:
@@ -1685,16 +1986,35 @@ class StatementRecord:
         self.resolved_correctness = True
         return self.type_correct
 
-    def generate_code(self, **context) -> "NestedStrList":
+    def eliminate_dead_code(self) -> bool:
+        """
+        Removes statements that can never run from inside this statement.
+        Returns True if control never reaches the end of this statement (e.g. return, break).
+        """
+        return False
+
+    def assigned_vars(self) -> int:
+        """
+        Returns the variables running this statement may assign, as a bitset of `1 << VariableRecord.id`.
+        """
+        # declarations, skips, breaks and continues assign nothing
+        return 0
+
+    @abstractmethod
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # subclasses need to implement this to support code generation
-        raise Exception("not implemented")
+        # instructions are appended to the sink in order, nothing is returned
+        pass
 
+    @abstractmethod
     def __repr__(self):
         # purposely added here because sub-classes are supposed to implement this
-        raise Exception("Not implemented")
+        pass
 
 
 class IfStatementRecord(StatementRecord):
+    __slots__ = ("if_expr", "then_stmt", "else_stmt")
+
     def __init__(
         self,
         location: StmtRange,
@@ -1708,7 +2028,10 @@ class IfStatementRecord(StatementRecord):
         self.else_stmt = else_stmt
 
     def compute_type_correct(self, **context):
-        if self.if_expr.resolve_type(**context) != BuiltInTypeRecordCollection.BOOLEAN:
+        if (
+            self.if_expr.resolve_type(**context)
+            is not BuiltInTypeRecordCollection.BOOLEAN
+        ):
             raise Exception(
                 f"expected the if-statement condition to be a boolean at lines {self.if_expr.location}"
             )
@@ -1719,35 +2042,47 @@ class IfStatementRecord(StatementRecord):
             return self.else_stmt.resolve_type_correct(**context)
         return False
 
-    def generate_code(self, **context):
-        condition_code = self.if_expr.generate_code(**context)
+    def eliminate_dead_code(self) -> bool:
+        then_exits = self.then_stmt.eliminate_dead_code()
+        if self.else_stmt == None:
+            return False
+        # both branches have to be checked so that each one is cleaned up
+        else_exits = self.else_stmt.eliminate_dead_code()
+        return then_exits and else_exits
+
+    def assigned_vars(self):
+        assigned = self.if_expr.assigned_vars() | self.then_stmt.assigned_vars()
+        if self.else_stmt != None:
+            assigned |= self.else_stmt.assigned_vars()
+        return assigned
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        self.if_expr.generate_code(sink, ctx)
         condition_t = self.if_expr.get_value_register()
 
-        end_l = LabelGenerator.next()
+        end_l = next_label()
 
-        then_code = self.then_stmt.generate_code(**context)
+        # constants loaded inside a branch may not have been loaded if the branch was skipped
+        consts = save_consts()
 
         if self.else_stmt == None:
-            return [
-                condition_code,
-                f"bz {condition_t}, {end_l}",
-                then_code,
-                f"{end_l}:",
-            ]
+            sink.emit(f"bz {condition_t}, {end_l}")
+            self.then_stmt.generate_code(sink, ctx)
+            restore_consts(consts)
+            sink.emit(f"{end_l}:")
+            return
 
         # handle the case where there is an else statement
-        else_code = self.then_stmt.generate_code(**context)
-        else_l = LabelGenerator.next()
-
-        return [
-            condition_code,
-            f"bz {condition_t}, {else_l}",
-            then_code,
-            f"jmp {end_l}",
-            f"{else_l}:",
-            else_code,
-            f"{end_l}:",
-        ]
+        else_l = next_label()
+
+        sink.emit(f"bz {condition_t}, {else_l}")
+        self.then_stmt.generate_code(sink, ctx)
+        restore_consts(consts)
+        sink.emit(f"jmp {end_l}")
+        sink.emit(f"{else_l}:")
+        self.else_stmt.generate_code(sink, ctx)
+        restore_consts(consts)
+        sink.emit(f"{end_l}:")
 
     def __repr__(self):
         if self.else_stmt != None:
@@ -1756,6 +2091,8 @@ class IfStatementRecord(StatementRecord):
 
 
 class WhileStatementRecord(StatementRecord):
+    __slots__ = ("while_condition", "while_body")
+
     def __init__(
         self,
         location: StmtRange,
@@ -1769,38 +2106,59 @@ class WhileStatementRecord(StatementRecord):
     def compute_type_correct(self, **context):
         if (
             self.while_condition.resolve_type(**context)
-            != BuiltInTypeRecordCollection.BOOLEAN
+            is not BuiltInTypeRecordCollection.BOOLEAN
         ):
             raise Exception(
                 f"expected the while-statement condition to be a boolean at lines {self.while_condition.location}"
             )
         return self.while_body.resolve_type_correct(**context)
 
-    def generate_code(self, **context):
-        condition_code = self.while_condition.generate_code(**context)
-        condition_t = self.while_condition.get_value_register()
+    def eliminate_dead_code(self) -> bool:
+        # a break leaves the loop, so the code after the loop is still reachable
+        self.while_body.eliminate_dead_code()
+        return False
 
-        loop_test_l = LabelGenerator.next()
-        loop_end_l = LabelGenerator.next()
+    def assigned_vars(self):
+        return self.while_condition.assigned_vars() | self.while_body.assigned_vars()
 
-        body_code = self.while_body.generate_code(
-            **{**context, "loop_test_l": loop_test_l, "loop_end_l": loop_end_l}
-        )
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        loop_test_l = next_label()
+        loop_end_l = next_label()
 
-        return [
-            f"{loop_test_l}:",
-            condition_code,
-            f"bz {condition_t}, {loop_end_l}",
-            body_code,
-            f"jmp {loop_test_l}",
-            f"{loop_end_l}:",
-        ]
+        # a condition that only reads variables the body never assigns gives the same answer on every pass
+        #   so it is only tested once, before the loop is entered
+        invariant = not (
+            self.while_condition.effects & ~ExpressionRecord.READS_VARIABLES
+            or self.while_condition.read_vars() & self.while_body.assigned_vars()
+        )
+        if invariant:
+            self.while_condition.generate_code(sink, ctx)
+            condition_t = self.while_condition.get_value_register()
+            sink.emit(f"bz {condition_t}, {loop_end_l}")
+
+        sink.emit(f"{loop_test_l}:")
+        if not invariant:
+            self.while_condition.generate_code(sink, ctx)
+            condition_t = self.while_condition.get_value_register()
+            sink.emit(f"bz {condition_t}, {loop_end_l}")
+
+        # constants loaded by the condition are loaded on every pass, but the body may never run
+        consts = save_consts()
+        outer_labels = ctx.enter_loop(loop_test_l, loop_end_l)
+        self.while_body.generate_code(sink, ctx)
+        ctx.exit_loop(outer_labels)
+        restore_consts(consts)
+
+        sink.emit(f"jmp {loop_test_l}")
+        sink.emit(f"{loop_end_l}:")
 
     def __repr__(self):
         return f"While( {self.while_condition}, {self.while_body} )"
 
 
 class ForStatementRecord(StatementRecord):
+    __slots__ = ("init_expr", "loop_condition", "update_expr", "loop_body")
+
     def __init__(
         self,
         location: StmtRange,
@@ -1815,10 +2173,16 @@ class ForStatementRecord(StatementRecord):
         self.update_expr = update_expr
         self.loop_body = loop_body
 
+        # only the condition is ever read
+        if init_expr != None:
+            init_expr.discard_value()
+        if update_expr != None:
+            update_expr.discard_value()
+
     def compute_type_correct(self, **context):
         if (
             self.loop_condition.resolve_type(**context)
-            != BuiltInTypeRecordCollection.BOOLEAN
+            is not BuiltInTypeRecordCollection.BOOLEAN
         ):
             raise Exception(
                 f"expected the for-statement condition to be a boolean at lines {self.loop_condition.location}"
@@ -1828,44 +2192,63 @@ class ForStatementRecord(StatementRecord):
         self.update_expr.resolve_type(**context)
         return self.loop_body.resolve_type_correct(**context)
 
-    def generate_code(self, **context):
-        init_code = self.init_expr.generate_code(**context)
+    def eliminate_dead_code(self) -> bool:
+        # a break leaves the loop, so the code after the loop is still reachable
+        self.loop_body.eliminate_dead_code()
+        return False
+
+    def assigned_vars(self):
+        return (
+            self.init_expr.assigned_vars()
+            | self.loop_condition.assigned_vars()
+            | self.update_expr.assigned_vars()
+            | self.loop_body.assigned_vars()
+        )
 
-        condition_code = self.loop_condition.generate_code(**context)
-        condition_t = self.loop_condition.get_value_register()
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        self.init_expr.generate_code(sink, ctx)
 
-        loop_test_l = LabelGenerator.next()
-        loop_end_l = LabelGenerator.next()
+        loop_test_l = next_label()
+        loop_end_l = next_label()
 
-        body_code = self.loop_body.generate_code(
-            **{**context, "loop_test_l": loop_test_l, "loop_end_l": loop_end_l}
+        # a condition that only reads variables the body and update never assign gives the same answer on every pass
+        #   so it is only tested once, before the loop is entered
+        invariant = not (
+            self.loop_condition.effects & ~ExpressionRecord.READS_VARIABLES
+            or self.loop_condition.read_vars()
+            & (self.loop_body.assigned_vars() | self.update_expr.assigned_vars())
         )
-
-        update_code = self.update_expr.generate_code(**context)
-
-        return [
-            init_code,
-            f"{loop_test_l}:",
-            condition_code,
-            f"bz {condition_t}, {loop_end_l}",
-            body_code,
-            update_code,
-            f"jmp {loop_test_l}",
-            f"{loop_end_l}:",
-        ]
+        if invariant:
+            self.loop_condition.generate_code(sink, ctx)
+            condition_t = self.loop_condition.get_value_register()
+            sink.emit(f"bz {condition_t}, {loop_end_l}")
+
+        sink.emit(f"{loop_test_l}:")
+        if not invariant:
+            self.loop_condition.generate_code(sink, ctx)
+            condition_t = self.loop_condition.get_value_register()
+            sink.emit(f"bz {condition_t}, {loop_end_l}")
+
+        # constants loaded by the condition are loaded on every pass, but the body and update may never run
+        consts = save_consts()
+        outer_labels = ctx.enter_loop(loop_test_l, loop_end_l)
+        self.loop_body.generate_code(sink, ctx)
+        ctx.exit_loop(outer_labels)
+        restore_consts(consts)
+
+        self.update_expr.generate_code(sink, ctx)
+        restore_consts(consts)
+
+        sink.emit(f"jmp {loop_test_l}")
+        sink.emit(f"{loop_end_l}:")
 
     def __repr__(self):
-        return ", ".join(
-            [
-                f"For( {self.init_expr}",
-                f"{self.loop_condition}",
-                f"{self.update_expr}",
-                f"{self.loop_body} )",
-            ]
-        )
+        return f"For( {self.init_expr}, {self.loop_condition}, {self.update_expr}, {self.loop_body} )"
 
 
 class ReturnStatementRecord(StatementRecord):
+    __slots__ = ("return_value", "expected_return_type", "casts_to_float")
+
     def __init__(self, location: StmtRange, return_value: Optional["ExpressionRecord"]):
         super().__init__(location)
         self.return_value = return_value
@@ -1873,6 +2256,9 @@ class ReturnStatementRecord(StatementRecord):
         # this needs to be set during type checking
         self.expected_return_type: "TypeRecord" = None
 
+        # whether the value is an INT returned from a FLOAT method (set during type checking)
+        self.casts_to_float = False
+
     def compute_type_correct(self, **context):
         method_type: Literal["method", "constructor"] = context["method_type"]
         if method_type == "constructor":
@@ -1885,7 +2271,7 @@ class ReturnStatementRecord(StatementRecord):
 
         if self.return_value == None:
             # if the current return value is None, then the expected return type should be None
-            if expected_return_type == BuiltInTypeRecordCollection.VOID:
+            if expected_return_type is BuiltInTypeRecordCollection.VOID:
                 return True
 
             # otherwise, it is a problem
@@ -1894,22 +2280,33 @@ class ReturnStatementRecord(StatementRecord):
             )
         else:
             # if there is a non-void return value, then the expected return type should not be void
-            if expected_return_type == BuiltInTypeRecordCollection.VOID:
+            if expected_return_type is BuiltInTypeRecordCollection.VOID:
                 raise Exception(
                     f"expected the return-statement to return nothing for a void method at lines {self.location}"
                 )
             # if the expected return type is not void, then we may be fine
 
-        if not DependencyTree.is_subtype(
-            self.return_value.resolve_type(**context), expected_return_type
-        ):
+        value_type = self.return_value.resolve_type(**context)
+        if not DependencyTree.is_subtype(value_type, expected_return_type):
             raise Exception(
                 f"expected the return-statement to return a compatible subtype at lines {self.location}"
             )
 
+        self.casts_to_float = (
+            expected_return_type is BuiltInTypeRecordCollection.FLOAT
+            and value_type is BuiltInTypeRecordCollection.INT
+        )
+        return True
+
+    def eliminate_dead_code(self) -> bool:
         return True
 
-    def generate_code(self, **context):
+    def assigned_vars(self):
+        if self.return_value == None:
+            return 0
+        return self.return_value.assigned_vars()
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # NOTE:
         # through type checking, we know that this return statement
         #   - is not inside a constructor
@@ -1917,44 +2314,53 @@ class ReturnStatementRecord(StatementRecord):
 
         # if the return value is None, then we can just call return
         if self.return_value == None:
-            return ["ret"]
+            sink.emit("ret")
+            return
 
         # now we know that a value must be returned
         # through type checking, we already determined what the return type should be
-        out = [self.return_value.generate_code(**context)]
+        self.return_value.generate_code(sink, ctx)
         value_t = self.return_value.get_value_register()
 
         # NOTE: the return value is definitely a subtype of the expected return type
-        #   so we need to do casting if necessary
-        if (
-            self.expected_return_type == BuiltInTypeRecordCollection.FLOAT
-            and self.return_value.type == BuiltInTypeRecordCollection.INT
-        ):
-            out.append(f"itof {value_t}, {value_t}")
+        #   so we need to do casting if necessary (already decided during type checking)
+        if self.casts_to_float:
+            sink.emit(f"itof {value_t}, {value_t}")
 
-        return [out, f"move a0, {value_t}", f"# a0 = {value_t}", "ret"]
+        sink.emit(f"move a0, {value_t}")
+        if EMIT_COMMENTS:
+            emit_comment(sink, f"a0 = {value_t}")
+        sink.emit("ret")
 
     def __repr__(self):
         return f"Return( {self.return_value} )"
 
 
 class ExprStatementRecord(StatementRecord):
+    __slots__ = ("expr",)
+
     def __init__(self, location: StmtRange, expr: "ExpressionRecord"):
         super().__init__(location)
         self.expr = expr
+        expr.discard_value()
 
     def compute_type_correct(self, **context):
         self.expr.resolve_type(**context)
         return True
 
-    def generate_code(self, **context):
-        return self.expr.generate_code(**context)
+    def assigned_vars(self):
+        return self.expr.assigned_vars()
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        self.expr.generate_code(sink, ctx)
 
     def __repr__(self):
         return f"Expr( {self.expr} )"
 
 
 class BlockStatementRecord(StatementRecord):
+    __slots__ = ("stmt_seq",)
+
     def __init__(self, location: StmtRange, stmt_seq: List["StatementRecord"]):
         super().__init__(location)
         self.stmt_seq = stmt_seq
@@ -1965,8 +2371,23 @@ class BlockStatementRecord(StatementRecord):
                 return False
         return True
 
-    def generate_code(self, **context):
-        return [stmt.generate_code(**context) for stmt in self.stmt_seq]
+    def eliminate_dead_code(self) -> bool:
+        for i, stmt in enumerate(self.stmt_seq):
+            if stmt.eliminate_dead_code():
+                # nothing after this statement can run
+                del self.stmt_seq[i + 1 :]
+                return True
+        return False
+
+    def assigned_vars(self):
+        assigned = 0
+        for stmt in self.stmt_seq:
+            assigned |= stmt.assigned_vars()
+        return assigned
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        for stmt in self.stmt_seq:
+            stmt.generate_code(sink, ctx)
 
     def __repr__(self):
         if len(self.stmt_seq) < 1:
@@ -1977,49 +2398,61 @@ class BlockStatementRecord(StatementRecord):
 
 
 class BreakStatementRecord(StatementRecord):
+    __slots__ = ()
+
     def __init__(self, location: StmtRange):
         super().__init__(location)
 
     def compute_type_correct(self, **context):
         return True
 
-    def generate_code(self, **context):
-        loop_end_l = context["loop_end_l"]
+    def eliminate_dead_code(self) -> bool:
+        return True
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        loop_end_l = ctx.loop_end_l
         if loop_end_l == None:
             raise Exception("expected a label for loop_end to be passed")
-        return [f"jmp {loop_end_l}"]
+        sink.emit(f"jmp {loop_end_l}")
 
     def __repr__(self):
         return "Break"
 
 
 class ContinueStatementRecord(StatementRecord):
+    __slots__ = ()
+
     def __init__(self, location: StmtRange):
         super().__init__(location)
 
     def compute_type_correct(self, **context):
         return True
 
-    def generate_code(self, **context):
-        loop_test_l = context["loop_test_l"]
+    def eliminate_dead_code(self) -> bool:
+        return True
+
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
+        loop_test_l = ctx.loop_test_l
         if loop_test_l == None:
             raise Exception("expected a label for loop_post_test to be passed")
-        return [f"jmp {loop_test_l}"]
+        sink.emit(f"jmp {loop_test_l}")
 
     def __repr__(self):
         return "Continue"
 
 
 class SkipStatementRecord(StatementRecord):
+    __slots__ = ()
+
     def __init__(self, location: StmtRange):
         super().__init__(location)
 
     def compute_type_correct(self, **context):
         return True
 
-    def generate_code(self, **context):
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # no code needed because this statement is meant to be skipped
-        return []
+        pass
 
     def __repr__(self):
         return "Skip"
@@ -2030,6 +2463,8 @@ class VariableDeclarationStatementRecord(StatementRecord):
     this class does absolutely nothing, but helps us filter declarations from body during printing
     """
 
+    __slots__ = ("variables",)
+
     def __init__(self, location: StmtRange, variables: List["VariableRecord"]):
         super().__init__(location)
         self.variables = variables
@@ -2037,7 +2472,7 @@ class VariableDeclarationStatementRecord(StatementRecord):
     def compute_type_correct(self, **context):
         return True
 
-    def generate_code(self, **context):
+    def generate_code(self, sink: "CodeSink", ctx: "CodeGenContext"):
         # NOTE:
         # unlike ast printing or type checking where nothing is done
         # in code generation, we actually do something
@@ -2047,8 +2482,8 @@ class VariableDeclarationStatementRecord(StatementRecord):
         # for v in self.variables:
         #     if v.value_reg != None:
         #         raise Exception("variable is already somehow assigned a register")
-        #     v.value_reg = GlobalTemporaryRegisterGenerator.next()
-        return []
+        #     v.value_reg = next_tmp()
+        pass
 
     def __repr__(self):
         names = ", ".join([f"({v.name}, {v.id})" for v in self.variables])
@@ -2060,6 +2495,8 @@ class VariableRecord:
     Assigned: @BrianShao123
     """
 
+    __slots__ = ("name", "variable_kind", "type", "id", "value_reg")
+
     def __init__(
         self, type: "TypeRecord", variable_kind: Literal["formal", "local"], name: str
     ):
@@ -2088,5 +2525,5 @@ class VariableRecord:
             # raise Exception(
             #     f"tried to get register for Var[id={self.id}, name={self.name}], but it is not set"
             # )
-            self.value_reg = GlobalTemporaryRegisterGenerator.next()
+            self.value_reg = next_tmp()
         return self.value_reg
@@ -4,14 +4,13 @@ import traceback
 from typing import List
 import ply.lex as lex
 import ply.yacc as yacc
-from decaf_absmc import print_code
+from decaf_absmc import StreamingCodeSink, open_output
 from decaf_ast import ClassRecord
-from decaf_codegen import resolve_sizes_and_offsets
+from decaf_codegen import eliminate_dead_code, resolve_sizes_and_offsets
 import decaf_lexer
 import decaf_parser
 from decaf_config import *
 from decaf_typecheck import type_check
-from decaf_util import NestedStrList
 
 
 def get_filename():
@@ -28,7 +27,15 @@ def create_lexer():
 
 
 def create_parser():
-    return yacc.yacc(module=decaf_parser, debug=PARSER_DEBUG)
+    # the tables are written next to the parser once and loaded on every later run
+    #   the grammar signature is still checked, so stale tables are rebuilt instead of used
+    # NOTE: decaf_parsetab.py is committed, so regenerate it with `make tables` and commit it together with any grammar change
+    return yacc.yacc(
+        module=decaf_parser,
+        debug=PARSER_DEBUG,
+        tabmodule="decaf_parsetab",
+        outputdir=str(Path(decaf_parser.__file__).parent),
+    )
 
 
 def get_file(filename: str):
@@ -47,7 +54,8 @@ def get_output_path(filename: str):
 def print_classes(classes: List["ClassRecord"], file):
     print(LINE, file=file)
     for c in classes:
-        print(c, file=file)
+        c.write_repr(file)
+        print(file=file)
         print(LINE, file=file)
 
 def main():
@@ -84,21 +92,25 @@ def main():
     #     print_classes(classes, file)
     # return
 
-    abcmc: "NestedStrList" = None
+    out_name = get_output_path(file_path)
     try:
+        eliminate_dead_code(classes)
         static_slots = resolve_sizes_and_offsets(classes)
-        abcmc = [c.generate_code() for c in classes]
-        abcmc.append(f".static_data {static_slots}")
+        # code is written out as each procedure is generated instead of being held until the end
+        with open_output(out_name) as file:
+            sink = StreamingCodeSink(file)
+            for c in classes:
+                c.generate_code(sink)
+            sink.emit(f".static_data {static_slots}")
+            sink.flush()
     except Exception as e:
         print("code generator encountered problem!!!")
         print(traceback.format_exc())
         print(e)
+        # do not leave a partially written program behind
+        Path(out_name).unlink(missing_ok=True)
         exit(1)
 
-    out_name = get_output_path(file_path)
-    with open(out_name, "w") as file:
-        print_code(abcmc, file)
-
 
 if __name__ == "__main__":
     main()
@@ -26,8 +26,15 @@ def t_mlcomment_end(t):
 
 
 def t_mlcomment_content(t):
-    r"[^*]+(\*(?!/)[^*]*)*"
-    pass
+    r"[^\n]"
+    # the rest of the comment is skipped in one go by searching for where it ends
+    #   newlines inside it still need to be counted
+    lexdata = t.lexer.lexdata
+    end = lexdata.find("*/", t.lexpos)
+    if end == -1:
+        end = len(lexdata)
+    t.lexer.lineno += lexdata.count("\n", t.lexpos, end)
+    t.lexer.lexpos = end
 
 
 # we dont ignore anything because spacing is important for distinguishing between "*/" and "* /"
@@ -57,31 +64,20 @@ t_MINUS = r"-"
 t_TIMES = r"\*"
 t_DIVIDE = r"/"
 t_EQUAL = r"="
-t_DOUBLE_PLUS = r"\+\+"
-t_DOUBLE_MINUS = r"--"
-t_AND = r"&&"
-t_OR = r"\|\|"
 t_NOT = r"!"
-t_DOUBLE_EQUAL = r"=="
-t_NOT_EQUAL = r"!="
 t_LESS = r"<"
-t_LESS_EQUAL = r"<="
 t_GREATER = r">"
-t_GREATER_EQUAL = r">="
+
+# reserved words whose token carries a value other than the matched text
+reserved_values = {"NULL": None, "TRUE": True, "FALSE": False}
+
 
 def t_ID(t):
-    r"[a-zA-z][a-zA-Z0-9_]*"
+    r"[A-Za-z_][A-Za-z0-9_]*"
 
     t.type = reserved_words.get(t.value, "ID")
-    match t.type:
-        case "NULL":
-            t.value = None
-        case "TRUE":
-            t.value = True
-        case "FALSE":
-            t.value = False
-        case _:
-            pass
+    if t.type in reserved_values:
+        t.value = reserved_values[t.type]
 
     return t
 
@@ -103,6 +99,41 @@ def t_newline(t):
     r"\n+"
     t.lexer.lineno += len(t.value)
 
+# two-character operators are functions so that they are tried in this order before every single-character string rule
+#   (PLY adds function rules in definition order, then string rules sorted by regex length)
+# they come after the rules above so that identifiers and numbers do not try them first
+def t_DOUBLE_EQUAL(t):
+    r"=="
+    return t
+
+def t_NOT_EQUAL(t):
+    r"!="
+    return t
+
+def t_LESS_EQUAL(t):
+    r"<="
+    return t
+
+def t_GREATER_EQUAL(t):
+    r">="
+    return t
+
+def t_AND(t):
+    r"&&"
+    return t
+
+def t_OR(t):
+    r"\|\|"
+    return t
+
+def t_DOUBLE_PLUS(t):
+    r"\+\+"
+    return t
+
+def t_DOUBLE_MINUS(t):
+    r"--"
+    return t
+
 t_ignore = " \t"
 
 def t_error(t):
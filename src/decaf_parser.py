@@ -22,14 +22,15 @@ def p_empty(p):
 
 def p_program(p):
     """
-    program : class_decl program
+    program : program class_decl
             | empty
     """
+    # left recursion hands back the classes in order, so each one is appended instead of prepended
     if len(p) == 2:
         p[0] = []
     else:
-        p[2].insert(0, p[1])
-        p[0] = p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 from rules.class_declarations import *
@@ -0,0 +1,130 @@
+
+# decaf_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programrightEQUALleftORleftANDnonassocDOUBLE_EQUALNOT_EQUALnonassocLESSLESS_EQUALGREATERGREATER_EQUALleftPLUSMINUSleftTIMESDIVIDErightUMINUSUPLUSNOTAND BOOLEAN BREAK CLASS COMMA CONTINUE DIVIDE DOT DOUBLE_EQUAL DOUBLE_MINUS DOUBLE_PLUS ELSE EQUAL EXTENDS FALSE FLOAT FLOAT_CONSTANT FOR GREATER GREATER_EQUAL ID IF INT INTEGER_CONSTANT LBRACE LESS LESS_EQUAL LPAREN MINUS NEW NOT NOT_EQUAL NULL OR PLUS PRIVATE PUBLIC RBRACE RETURN RPAREN SEMICOLON STATIC STRING SUPER THIS TIMES TRUE VOID WHILE\n    expr : primary\n         | assign\n    \n    enter_function_scope : LPAREN\n    \n    class_decl : enter_class optional_extends LBRACE at_least_one_class_body_decl RBRACE\n    \n    field_decl : modifier var_decl\n    \n    primary : literal\n            | lhs\n            | method_invocation\n    \n    empty :\n    \n    enter_normal_scope : LBRACE\n    \n    program : program class_decl\n            | empty\n    \n    literal : INTEGER_CONSTANT\n    \n    method_decl : modifier type ID enter_function_scope optional_formals RPAREN block\n    \n    primary : LPAREN expr RPAREN\n    \n    block : enter_normal_scope stmt_list RBRACE\n    \n    literal : FLOAT_CONSTANT\n    \n    primary : NEW ID LPAREN optional_arguments RPAREN\n    \n    stmt_list : stmt_list stmt\n              | empty\n    \n    literal : STRING\n    \n    expr : expr PLUS expr\n         | expr MINUS expr\n         | expr TIMES expr\n         | expr DIVIDE expr\n         | expr AND expr\n         | expr OR expr\n         | expr DOUBLE_EQUAL expr\n         | expr NOT_EQUAL expr\n         | expr LESS_EQUAL expr\n         | expr GREATER_EQUAL expr\n         | expr LESS expr\n         | expr GREATER expr\n    \n    enter_class : CLASS ID\n    \n    primary : THIS\n    \n    modifier : optional_public_or_private optional_static\n    \n    literal : NULL\n    \n    constructor_decl : modifier ID enter_function_scope optional_formals RPAREN block\n    \n    primary : SUPER\n    \n    optional_extends : EXTENDS ID\n                     | empty\n    \n    optional_public_or_private : PUBLIC\n                               | PRIVATE\n                               | empty\n    \n    literal : TRUE\n            | FALSE\n    \n    expr : NOT expr\n         | MINUS expr %prec UMINUS\n    \n    optional_arguments : arguments\n                       | empty\n    \n    optional_static : STATIC\n                    | empty\n    \n    at_least_one_class_body_decl : at_least_one_class_body_decl class_body_decl\n                                 | class_body_decl\n    \n    expr : PLUS expr %prec UPLUS\n    \n    optional_formals : formals\n                     | empty\n    \n    stmt : var_decl\n    \n    assign : lhs EQUAL expr\n    \n    arguments : arguments COMMA expr\n              | expr\n    \n    var_decl : type variables SEMICOLON\n    \n    formals : formals COMMA formal_param\n            | formal_param\n    \n    stmt : SEMICOLON\n    \n    class_body_decl : field_decl\n    \n    assign : lhs DOUBLE_PLUS\n    \n    lhs : field_access\n    \n    formal_param : type variable\n    \n    stmt : block\n    \n    class_body_decl : method_decl\n    \n    assign : lhs DOUBLE_MINUS\n    \n    field_access : primary DOT ID\n                 | ID\n    \n    stmt : CONTINUE SEMICOLON\n    \n    class_body_decl : constructor_decl\n    \n    assign : DOUBLE_PLUS lhs\n    \n    type : INT\n    \n    assign : DOUBLE_MINUS lhs\n    \n    stmt : BREAK SEMICOLON\n    \n    type : FLOAT\n    \n    type : BOOLEAN\n    \n    stmt : stmt_expr SEMICOLON\n    \n    method_invocation : field_access LPAREN optional_arguments RPAREN\n    \n    type : VOID\n    \n    stmt : RETURN optional_expr SEMICOLON\n    \n    type : ID\n    \n    stmt : FOR LPAREN optional_stmt_expr SEMICOLON optional_expr SEMICOLON optional_stmt_expr RPAREN stmt\n    \n    variables : variable\n              | variables COMMA variable\n    \n    stmt : IF LPAREN expr RPAREN stmt\n         | IF LPAREN expr RPAREN stmt ELSE stmt\n    \n    variable : ID\n    \n    stmt : WHILE LPAREN expr RPAREN stmt\n    \n    optional_stmt_expr : stmt_expr\n                       | empty\n    \n    optional_expr : expr\n                  | empty\n    \n    stmt_expr : assign\n              | method_invocation\n    '
+    
+_lr_action_items = {'CLASS':([0,1,2,3,22,],[-9,5,-12,-11,-4,]),'$end':([0,1,2,3,22,],[-9,0,-12,-11,-4,]),'EXTENDS':([4,9,],[7,-34,]),'LBRACE':([4,6,8,9,11,40,51,54,56,57,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-9,10,-41,-34,-40,-62,57,57,-9,-10,57,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,57,57,-91,-94,57,-92,57,-88,]),'ID':([5,7,10,12,13,14,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,37,38,39,40,41,42,47,52,55,56,57,59,60,61,62,63,64,65,66,70,72,75,78,80,81,85,94,95,96,102,103,104,109,111,112,113,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[9,11,-9,-9,-54,-66,-71,-76,26,-9,-42,-43,-44,-53,-5,34,-87,-78,-81,-82,-85,-36,-51,-52,42,-3,42,-62,50,-87,50,42,-38,-9,-10,-14,78,-20,-16,-19,-58,-65,-70,107,107,50,-87,107,107,120,-75,-80,-83,107,107,107,107,107,107,107,107,148,-86,107,107,107,107,107,107,107,107,107,107,107,107,107,107,78,78,107,-91,-94,107,78,-92,78,-88,]),'PUBLIC':([10,12,13,14,15,16,23,24,40,55,59,62,],[19,19,-54,-66,-71,-76,-53,-5,-62,-38,-14,-16,]),'PRIVATE':([10,12,13,14,15,16,23,24,40,55,59,62,],[20,20,-54,-66,-71,-76,-53,-5,-62,-38,-14,-16,]),'STATIC':([10,12,13,14,15,16,18,19,20,21,23,24,40,55,59,62,],[-9,-9,-54,-66,-71,-76,32,-42,-43,-44,-53,-5,-62,-38,-14,-16,]),'INT':([10,12,13,14,15,16,17,18,19,20,21,23,24,31,32,33,37,38,39,40,52,55,56,57,59,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-9,-9,-54,-66,-71,-76,27,-9,-42,-43,-44,-53,-5,-36,-51,-52,27,-3,27,-62,27,-38,-9,-10,-14,27,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,27,27,-91,-94,27,-92,27,-88,]),'FLOAT':([10,12,13,14,15,16,17,18,19,20,21,23,24,31,32,33,37,38,39,40,52,55,56,57,59,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-9,-9,-54,-66,-71,-76,28,-9,-42,-43,-44,-53,-5,-36,-51,-52,28,-3,28,-62,28,-38,-9,-10,-14,28,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,28,28,-91,-94,28,-92,28,-88,]),'BOOLEAN':([10,12,13,14,15,16,17,18,19,20,21,23,24,31,32,33,37,38,39,40,52,55,56,57,59,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-9,-9,-54,-66,-71,-76,29,-9,-42,-43,-44,-53,-5,-36,-51,-52,29,-3,29,-62,29,-38,-9,-10,-14,29,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,29,29,-91,-94,29,-92,29,-88,]),'VOID':([10,12,13,14,15,16,17,18,19,20,21,23,24,31,32,33,37,38,39,40,52,55,56,57,59,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-9,-9,-54,-66,-71,-76,30,-9,-42,-43,-44,-53,-5,-36,-51,-52,30,-3,30,-62,30,-38,-9,-10,-14,30,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,30,30,-91,-94,30,-92,30,-88,]),'RBRACE':([12,13,14,15,16,23,24,40,55,56,57,59,60,61,62,63,64,65,66,94,95,96,121,169,170,176,178,],[22,-54,-66,-71,-76,-53,-5,-62,-38,-9,-10,-14,62,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,-91,-94,-92,-88,]),'LPAREN':([26,34,40,56,57,60,61,62,63,64,65,66,70,71,72,73,74,78,80,81,82,94,95,96,102,103,104,107,108,109,111,112,113,118,120,121,122,123,124,125,126,127,128,129,130,131,132,133,148,149,162,163,164,166,169,170,173,174,176,177,178,],[38,38,-62,-9,-10,72,-20,-16,-19,-58,-65,-70,72,109,72,111,112,-74,72,72,118,-75,-80,-83,72,72,72,-74,118,72,72,72,72,72,149,-86,72,72,72,72,72,72,72,72,72,72,72,72,-73,72,72,72,72,72,-91,-94,72,72,-92,72,-88,]),'SEMICOLON':([34,35,36,40,49,50,56,57,60,61,62,63,64,65,66,67,68,69,70,76,77,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,105,106,107,108,109,114,115,116,117,121,134,135,136,137,138,139,140,143,148,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,168,169,170,172,174,176,177,178,],[-93,40,-89,-62,-90,-93,-9,-10,65,-20,-16,-19,-58,-65,-70,94,95,96,-9,-99,-100,-6,-35,-39,-13,-17,-21,-37,-45,-46,-75,-80,-83,121,-97,-98,-1,-2,-7,-8,-74,-68,-9,-67,-72,-77,-79,-86,-55,-48,-47,162,-95,-96,-15,-59,-73,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-9,65,65,-84,173,-91,-94,-18,65,-92,65,-88,]),'COMMA':([34,35,36,44,46,49,50,53,58,84,86,87,88,89,90,91,92,93,100,101,105,106,107,108,114,115,116,117,134,135,136,140,143,145,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-93,41,-89,52,-64,-90,-93,-69,-63,-6,-35,-39,-13,-17,-21,-37,-45,-46,-1,-2,-7,-8,-74,-68,-67,-72,-77,-79,-55,-48,-47,-15,-59,166,-61,-73,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-84,-60,-18,]),'RPAREN':([37,38,39,43,44,45,46,48,50,53,58,76,77,84,86,87,88,89,90,91,92,93,100,101,105,106,107,108,110,114,115,116,117,118,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,165,167,171,172,173,175,],[-9,-3,-9,51,-56,-57,-64,54,-93,-69,-63,-99,-100,-6,-35,-39,-13,-17,-21,-37,-45,-46,-1,-2,-7,-8,-74,-68,140,-67,-72,-77,-79,-9,-55,-48,-47,-95,-96,-15,163,164,-59,165,-49,-50,-61,-73,-9,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-84,172,-60,-18,-9,177,]),'CONTINUE':([40,56,57,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-62,-9,-10,67,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,67,67,-91,-94,67,-92,67,-88,]),'BREAK':([40,56,57,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-62,-9,-10,68,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,68,68,-91,-94,68,-92,68,-88,]),'RETURN':([40,56,57,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-62,-9,-10,70,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,70,70,-91,-94,70,-92,70,-88,]),'FOR':([40,56,57,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-62,-9,-10,71,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,71,71,-91,-94,71,-92,71,-88,]),'IF':([40,56,57,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-62,-9,-10,73,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,73,73,-91,-94,73,-92,73,-88,]),'WHILE':([40,56,57,60,61,62,63,64,65,66,94,95,96,121,163,164,169,170,174,176,177,178,],[-62,-9,-10,74,-20,-16,-19,-58,-65,-70,-75,-80,-83,-86,74,74,-91,-94,74,-92,74,-88,]),'DOUBLE_PLUS':([40,56,57,60,61,62,63,64,65,66,70,72,78,79,82,94,95,96,102,103,104,105,107,108,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,148,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,80,-20,-16,-19,-58,-65,-70,80,80,-74,114,-68,-75,-80,-83,80,80,80,114,-74,-68,80,80,80,80,80,-86,80,80,80,80,80,80,80,80,80,80,80,80,-73,80,80,80,80,80,-91,-94,80,80,-92,80,-88,]),'DOUBLE_MINUS':([40,56,57,60,61,62,63,64,65,66,70,72,78,79,82,94,95,96,102,103,104,105,107,108,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,148,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,81,-20,-16,-19,-58,-65,-70,81,81,-74,115,-68,-75,-80,-83,81,81,81,115,-74,-68,81,81,81,81,81,-86,81,81,81,81,81,81,81,81,81,81,81,81,-73,81,81,81,81,81,-91,-94,81,81,-92,81,-88,]),'NEW':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,85,-20,-16,-19,-58,-65,-70,85,85,85,85,-75,-80,-83,85,85,85,85,85,85,85,85,-86,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-91,-94,85,85,-92,85,-88,]),'THIS':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,86,-20,-16,-19,-58,-65,-70,86,86,86,86,-75,-80,-83,86,86,86,86,86,86,86,86,-86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-91,-94,86,86,-92,86,-88,]),'SUPER':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,87,-20,-16,-19,-58,-65,-70,87,87,87,87,-75,-80,-83,87,87,87,87,87,87,87,87,-86,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-91,-94,87,87,-92,87,-88,]),'INTEGER_CONSTANT':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,88,-20,-16,-19,-58,-65,-70,88,88,88,88,-75,-80,-83,88,88,88,88,88,88,88,88,-86,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-91,-94,88,88,-92,88,-88,]),'FLOAT_CONSTANT':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,89,-20,-16,-19,-58,-65,-70,89,89,89,89,-75,-80,-83,89,89,89,89,89,89,89,89,-86,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-91,-94,89,89,-92,89,-88,]),'STRING':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,90,-20,-16,-19,-58,-65,-70,90,90,90,90,-75,-80,-83,90,90,90,90,90,90,90,90,-86,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-91,-94,90,90,-92,90,-88,]),'NULL':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,91,-20,-16,-19,-58,-65,-70,91,91,91,91,-75,-80,-83,91,91,91,91,91,91,91,91,-86,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-91,-94,91,91,-92,91,-88,]),'TRUE':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,92,-20,-16,-19,-58,-65,-70,92,92,92,92,-75,-80,-83,92,92,92,92,92,92,92,92,-86,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-91,-94,92,92,-92,92,-88,]),'FALSE':([40,56,57,60,61,62,63,64,65,66,70,72,80,81,94,95,96,102,103,104,109,111,112,113,118,121,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,169,170,173,174,176,177,178,],[-62,-9,-10,93,-20,-16,-19,-58,-65,-70,93,93,93,93,-75,-80,-83,93,93,93,93,93,93,93,93,-86,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-91,-94,93,93,-92,93,-88,]),'ELSE':([40,62,64,65,66,94,95,96,121,169,170,176,178,],[-62,-16,-58,-65,-70,-75,-80,-83,-86,174,-94,-92,-88,]),'NOT':([70,72,102,103,104,111,112,113,118,122,123,124,125,126,127,128,129,130,131,132,133,149,162,166,],[104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'MINUS':([70,72,84,86,87,88,89,90,91,92,93,98,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,116,117,118,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,142,143,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,165,166,171,172,],[103,103,-6,-35,-39,-13,-17,-21,-37,-45,-46,123,-1,-2,103,103,103,-7,-8,-74,-68,123,103,103,103,-67,-72,-77,-79,103,103,103,103,103,103,103,103,103,103,103,103,103,-55,-48,-47,-15,123,123,123,123,-73,103,-22,-23,-24,-25,123,123,123,123,123,123,123,123,103,-84,103,123,-18,]),'PLUS':([70,72,84,86,87,88,89,90,91,92,93,98,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,116,117,118,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,142,143,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,165,166,171,172,],[102,102,-6,-35,-39,-13,-17,-21,-37,-45,-46,122,-1,-2,102,102,102,-7,-8,-74,-68,122,102,102,102,-67,-72,-77,-79,102,102,102,102,102,102,102,102,102,102,102,102,102,-55,-48,-47,-15,122,122,122,122,-73,102,-22,-23,-24,-25,122,122,122,122,122,122,122,122,102,-84,102,122,-18,]),'DOT':([77,78,79,82,83,84,86,87,88,89,90,91,92,93,100,105,106,107,108,116,117,140,148,165,172,],[-8,-74,-7,-68,119,-6,-35,-39,-13,-17,-21,-37,-45,-46,119,-7,-8,-74,-68,-7,-7,-15,-73,-84,-18,]),'EQUAL':([78,79,82,105,107,108,148,],[-74,113,-68,113,-74,-68,-73,]),'TIMES':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,124,-1,-2,-7,-8,-74,-68,124,-67,-72,-77,-79,-55,-48,-47,-15,124,124,124,124,-73,124,124,-24,-25,124,124,124,124,124,124,124,124,-84,124,-18,]),'DIVIDE':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,125,-1,-2,-7,-8,-74,-68,125,-67,-72,-77,-79,-55,-48,-47,-15,125,125,125,125,-73,125,125,-24,-25,125,125,125,125,125,125,125,125,-84,125,-18,]),'AND':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,126,-1,-2,-7,-8,-74,-68,126,-67,-72,-77,-79,-55,-48,-47,-15,126,126,126,126,-73,-22,-23,-24,-25,-26,126,-28,-29,-30,-31,-32,-33,-84,126,-18,]),'OR':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,127,-1,-2,-7,-8,-74,-68,127,-67,-72,-77,-79,-55,-48,-47,-15,127,127,127,127,-73,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-84,127,-18,]),'DOUBLE_EQUAL':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,128,-1,-2,-7,-8,-74,-68,128,-67,-72,-77,-79,-55,-48,-47,-15,128,128,128,128,-73,-22,-23,-24,-25,128,128,None,None,-30,-31,-32,-33,-84,128,-18,]),'NOT_EQUAL':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,129,-1,-2,-7,-8,-74,-68,129,-67,-72,-77,-79,-55,-48,-47,-15,129,129,129,129,-73,-22,-23,-24,-25,129,129,None,None,-30,-31,-32,-33,-84,129,-18,]),'LESS_EQUAL':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,130,-1,-2,-7,-8,-74,-68,130,-67,-72,-77,-79,-55,-48,-47,-15,130,130,130,130,-73,-22,-23,-24,-25,130,130,130,130,None,None,None,None,-84,130,-18,]),'GREATER_EQUAL':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,131,-1,-2,-7,-8,-74,-68,131,-67,-72,-77,-79,-55,-48,-47,-15,131,131,131,131,-73,-22,-23,-24,-25,131,131,131,131,None,None,None,None,-84,131,-18,]),'LESS':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,132,-1,-2,-7,-8,-74,-68,132,-67,-72,-77,-79,-55,-48,-47,-15,132,132,132,132,-73,-22,-23,-24,-25,132,132,132,132,None,None,None,None,-84,132,-18,]),'GREATER':([84,86,87,88,89,90,91,92,93,98,100,101,105,106,107,108,110,114,115,116,117,134,135,136,140,141,142,143,147,148,150,151,152,153,154,155,156,157,158,159,160,161,165,171,172,],[-6,-35,-39,-13,-17,-21,-37,-45,-46,133,-1,-2,-7,-8,-74,-68,133,-67,-72,-77,-79,-55,-48,-47,-15,133,133,133,133,-73,-22,-23,-24,-25,133,133,133,133,None,None,None,None,-84,133,-18,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'empty':([0,4,10,12,18,37,39,56,70,109,118,149,162,173,],[2,8,21,21,33,45,45,61,99,139,146,146,99,139,]),'class_decl':([1,],[3,]),'enter_class':([1,],[4,]),'optional_extends':([4,],[6,]),'at_least_one_class_body_decl':([10,],[12,]),'class_body_decl':([10,12,],[13,23,]),'field_decl':([10,12,],[14,14,]),'method_decl':([10,12,],[15,15,]),'constructor_decl':([10,12,],[16,16,]),'modifier':([10,12,],[17,17,]),'optional_public_or_private':([10,12,],[18,18,]),'var_decl':([17,60,163,164,174,177,],[24,64,64,64,64,64,]),'type':([17,37,39,52,60,163,164,174,177,],[25,47,47,47,75,75,75,75,75,]),'optional_static':([18,],[31,]),'variables':([25,75,],[35,35,]),'variable':([25,41,47,75,],[36,49,53,36,]),'enter_function_scope':([26,34,],[37,39,]),'optional_formals':([37,39,],[43,48,]),'formals':([37,39,],[44,44,]),'formal_param':([37,39,52,],[46,46,58,]),'block':([51,54,60,163,164,174,177,],[55,59,66,66,66,66,66,]),'enter_normal_scope':([51,54,60,163,164,174,177,],[56,56,56,56,56,56,56,]),'stmt_list':([56,],[60,]),'stmt':([60,163,164,174,177,],[63,169,170,176,178,]),'stmt_expr':([60,109,163,164,173,174,177,],[69,138,69,69,138,69,69,]),'assign':([60,70,72,102,103,104,109,111,112,113,118,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,173,174,177,],[76,101,101,101,101,101,76,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,76,76,101,76,76,76,]),'method_invocation':([60,70,72,80,81,102,103,104,109,111,112,113,118,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,173,174,177,],[77,106,106,106,106,106,106,106,77,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,77,77,106,77,77,77,]),'lhs':([60,70,72,80,81,102,103,104,109,111,112,113,118,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,173,174,177,],[79,105,105,116,117,105,105,105,79,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,79,79,105,79,79,79,]),'field_access':([60,70,72,80,81,102,103,104,109,111,112,113,118,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,173,174,177,],[82,108,108,108,108,108,108,108,82,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,82,82,108,82,82,82,]),'primary':([60,70,72,80,81,102,103,104,109,111,112,113,118,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,173,174,177,],[83,100,100,83,83,100,100,100,83,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,83,83,100,83,83,83,]),'literal':([60,70,72,80,81,102,103,104,109,111,112,113,118,122,123,124,125,126,127,128,129,130,131,132,133,149,162,163,164,166,173,174,177,],[84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,]),'optional_expr':([70,162,],[97,168,]),'expr':([70,72,102,103,104,111,112,113,118,122,123,124,125,126,127,128,129,130,131,132,133,149,162,166,],[98,110,134,135,136,141,142,143,147,150,151,152,153,154,155,156,157,158,159,160,161,147,98,171,]),'optional_stmt_expr':([109,173,],[137,175,]),'optional_arguments':([118,149,],[144,167,]),'arguments':([118,149,],[145,145,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('expr -> primary','expr',1,'p_expr_misc','expr.py',5),
+  ('expr -> assign','expr',1,'p_expr_misc','expr.py',6),
+  ('enter_function_scope -> LPAREN','enter_function_scope',1,'p_enter_function_scope','methods_and_constructor.py',7),
+  ('class_decl -> enter_class optional_extends LBRACE at_least_one_class_body_decl RBRACE','class_decl',5,'p_class_decl','class_declarations.py',14),
+  ('field_decl -> modifier var_decl','field_decl',2,'p_field_decl','fields.py',17),
+  ('primary -> literal','primary',1,'p_primary','primary.py',17),
+  ('primary -> lhs','primary',1,'p_primary','primary.py',18),
+  ('primary -> method_invocation','primary',1,'p_primary','primary.py',19),
+  ('empty -> <empty>','empty',0,'p_empty','decaf_parser.py',18),
+  ('enter_normal_scope -> LBRACE','enter_normal_scope',1,'p_enter_normal_scope','statements.py',21),
+  ('program -> program class_decl','program',2,'p_program','decaf_parser.py',25),
+  ('program -> empty','program',1,'p_program','decaf_parser.py',26),
+  ('literal -> INTEGER_CONSTANT','literal',1,'p_literal_int','literal.py',25),
+  ('method_decl -> modifier type ID enter_function_scope optional_formals RPAREN block','method_decl',7,'p_method_decl','methods_and_constructor.py',25),
+  ('primary -> LPAREN expr RPAREN','primary',3,'p_primary_wrapped_expr','primary.py',26),
+  ('block -> enter_normal_scope stmt_list RBRACE','block',3,'p_block','statements.py',28),
+  ('literal -> FLOAT_CONSTANT','literal',1,'p_literal_float','literal.py',32),
+  ('primary -> NEW ID LPAREN optional_arguments RPAREN','primary',5,'p_primary_new_object','primary.py',33),
+  ('stmt_list -> stmt_list stmt','stmt_list',2,'p_stmt_list','statements.py',38),
+  ('stmt_list -> empty','stmt_list',1,'p_stmt_list','statements.py',39),
+  ('literal -> STRING','literal',1,'p_literal_string','literal.py',39),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_binary','expr.py',40),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_binary','expr.py',41),
+  ('expr -> expr TIMES expr','expr',3,'p_expr_binary','expr.py',42),
+  ('expr -> expr DIVIDE expr','expr',3,'p_expr_binary','expr.py',43),
+  ('expr -> expr AND expr','expr',3,'p_expr_binary','expr.py',44),
+  ('expr -> expr OR expr','expr',3,'p_expr_binary','expr.py',45),
+  ('expr -> expr DOUBLE_EQUAL expr','expr',3,'p_expr_binary','expr.py',46),
+  ('expr -> expr NOT_EQUAL expr','expr',3,'p_expr_binary','expr.py',47),
+  ('expr -> expr LESS_EQUAL expr','expr',3,'p_expr_binary','expr.py',48),
+  ('expr -> expr GREATER_EQUAL expr','expr',3,'p_expr_binary','expr.py',49),
+  ('expr -> expr LESS expr','expr',3,'p_expr_binary','expr.py',50),
+  ('expr -> expr GREATER expr','expr',3,'p_expr_binary','expr.py',51),
+  ('enter_class -> CLASS ID','enter_class',2,'p_enter_class','class_declarations.py',42),
+  ('primary -> THIS','primary',1,'p_primary_this','primary.py',43),
+  ('modifier -> optional_public_or_private optional_static','modifier',2,'p_modifier','fields.py',45),
+  ('literal -> NULL','literal',1,'p_literal_null','literal.py',46),
+  ('constructor_decl -> modifier ID enter_function_scope optional_formals RPAREN block','constructor_decl',6,'p_constructor_decl','methods_and_constructor.py',47),
+  ('primary -> SUPER','primary',1,'p_primary_super','primary.py',52),
+  ('optional_extends -> EXTENDS ID','optional_extends',2,'p_optional_extends','class_declarations.py',53),
+  ('optional_extends -> empty','optional_extends',1,'p_optional_extends','class_declarations.py',54),
+  ('optional_public_or_private -> PUBLIC','optional_public_or_private',1,'p_optional_public_or_private','fields.py',53),
+  ('optional_public_or_private -> PRIVATE','optional_public_or_private',1,'p_optional_public_or_private','fields.py',54),
+  ('optional_public_or_private -> empty','optional_public_or_private',1,'p_optional_public_or_private','fields.py',55),
+  ('literal -> TRUE','literal',1,'p_literal_boolean','literal.py',53),
+  ('literal -> FALSE','literal',1,'p_literal_boolean','literal.py',54),
+  ('expr -> NOT expr','expr',2,'p_expr_unary','expr.py',58),
+  ('expr -> MINUS expr','expr',2,'p_expr_unary','expr.py',59),
+  ('optional_arguments -> arguments','optional_arguments',1,'p_optional_arguments','primary.py',61),
+  ('optional_arguments -> empty','optional_arguments',1,'p_optional_arguments','primary.py',62),
+  ('optional_static -> STATIC','optional_static',1,'p_optional_static','fields.py',63),
+  ('optional_static -> empty','optional_static',1,'p_optional_static','fields.py',64),
+  ('at_least_one_class_body_decl -> at_least_one_class_body_decl class_body_decl','at_least_one_class_body_decl',2,'p_at_least_one_class_body_decl','class_declarations.py',65),
+  ('at_least_one_class_body_decl -> class_body_decl','at_least_one_class_body_decl',1,'p_at_least_one_class_body_decl','class_declarations.py',66),
+  ('expr -> PLUS expr','expr',2,'p_expr_unary_plus','expr.py',65),
+  ('optional_formals -> formals','optional_formals',1,'p_optional_formals','methods_and_constructor.py',68),
+  ('optional_formals -> empty','optional_formals',1,'p_optional_formals','methods_and_constructor.py',69),
+  ('stmt -> var_decl','stmt',1,'p_stmt_var_decl','statements.py',70),
+  ('assign -> lhs EQUAL expr','assign',3,'p_assign_default','expr.py',72),
+  ('arguments -> arguments COMMA expr','arguments',3,'p_arguments','primary.py',75),
+  ('arguments -> expr','arguments',1,'p_arguments','primary.py',76),
+  ('var_decl -> type variables SEMICOLON','var_decl',3,'p_var_decl','fields.py',77),
+  ('formals -> formals COMMA formal_param','formals',3,'p_formals','methods_and_constructor.py',79),
+  ('formals -> formal_param','formals',1,'p_formals','methods_and_constructor.py',80),
+  ('stmt -> SEMICOLON','stmt',1,'p_skip_stmt','statements.py',84),
+  ('class_body_decl -> field_decl','class_body_decl',1,'p_class_body_decl_field','class_declarations.py',85),
+  ('assign -> lhs DOUBLE_PLUS','assign',2,'p_assign_post_inc','expr.py',87),
+  ('lhs -> field_access','lhs',1,'p_lhs','primary.py',87),
+  ('formal_param -> type variable','formal_param',2,'p_formal_param','methods_and_constructor.py',91),
+  ('stmt -> block','stmt',1,'p_block_stmt','statements.py',91),
+  ('class_body_decl -> method_decl','class_body_decl',1,'p_class_body_decl_method','class_declarations.py',92),
+  ('assign -> lhs DOUBLE_MINUS','assign',2,'p_assign_post_dec','expr.py',93),
+  ('field_access -> primary DOT ID','field_access',3,'p_field_access','primary.py',95),
+  ('field_access -> ID','field_access',1,'p_field_access','primary.py',96),
+  ('stmt -> CONTINUE SEMICOLON','stmt',2,'p_continue_stmt','statements.py',98),
+  ('class_body_decl -> constructor_decl','class_body_decl',1,'p_class_body_decl_constructor','class_declarations.py',99),
+  ('assign -> DOUBLE_PLUS lhs','assign',2,'p_assign_pre_inc','expr.py',99),
+  ('type -> INT','type',1,'p_type_int','fields.py',101),
+  ('assign -> DOUBLE_MINUS lhs','assign',2,'p_assign_pre_dec','expr.py',105),
+  ('stmt -> BREAK SEMICOLON','stmt',2,'p_break_stmt','statements.py',107),
+  ('type -> FLOAT','type',1,'p_type_float','fields.py',108),
+  ('type -> BOOLEAN','type',1,'p_type_boolean','fields.py',115),
+  ('stmt -> stmt_expr SEMICOLON','stmt',2,'p_expr_stmt','statements.py',116),
+  ('method_invocation -> field_access LPAREN optional_arguments RPAREN','method_invocation',4,'p_method_invocation','primary.py',118),
+  ('type -> VOID','type',1,'p_type_void','fields.py',122),
+  ('stmt -> RETURN optional_expr SEMICOLON','stmt',3,'p_return_stmt','statements.py',125),
+  ('type -> ID','type',1,'p_type_id','fields.py',129),
+  ('stmt -> FOR LPAREN optional_stmt_expr SEMICOLON optional_expr SEMICOLON optional_stmt_expr RPAREN stmt','stmt',9,'p_for_stmt','statements.py',134),
+  ('variables -> variable','variables',1,'p_variables','fields.py',136),
+  ('variables -> variables COMMA variable','variables',3,'p_variables','fields.py',137),
+  ('stmt -> IF LPAREN expr RPAREN stmt','stmt',5,'p_if_stmt','statements.py',145),
+  ('stmt -> IF LPAREN expr RPAREN stmt ELSE stmt','stmt',7,'p_if_stmt','statements.py',146),
+  ('variable -> ID','variable',1,'p_variable','fields.py',148),
+  ('stmt -> WHILE LPAREN expr RPAREN stmt','stmt',5,'p_while_stmt','statements.py',159),
+  ('optional_stmt_expr -> stmt_expr','optional_stmt_expr',1,'p_optional_stmt_expr','statements.py',168),
+  ('optional_stmt_expr -> empty','optional_stmt_expr',1,'p_optional_stmt_expr','statements.py',169),
+  ('optional_expr -> expr','optional_expr',1,'p_optional_expr','statements.py',176),
+  ('optional_expr -> empty','optional_expr',1,'p_optional_expr','statements.py',177),
+  ('stmt_expr -> assign','stmt_expr',1,'p_stmt_expr','statements.py',184),
+  ('stmt_expr -> method_invocation','stmt_expr',1,'p_stmt_expr','statements.py',185),
+]
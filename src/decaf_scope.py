@@ -43,6 +43,16 @@ class Scope:
             self.symbol_table = {}
             self.variable_table = []
 
+        # every symbol this scope can see, so a lookup is a single probe instead of a walk up the parents
+        #   a child sharing its parent's table sees exactly what the parent sees, so it shares this too
+        #   otherwise it starts from whatever the parent lets its children see
+        if not parent_scope or parent_scope.block_child:
+            self.visible_table = {}
+        elif parent_scope.share_table_with_child:
+            self.visible_table = parent_scope.visible_table
+        else:
+            self.visible_table = dict(parent_scope.visible_table)
+
         if class_name:
             self.class_name = class_name
         else:
@@ -64,6 +74,7 @@ class Scope:
             return False
 
         self.symbol_table[ref.name] = ref
+        self.visible_table[ref.name] = ref
         ref.id = len(self.variable_table) + 1
         self.variable_table.append(ref)
         return True
@@ -78,14 +89,13 @@ class Scope:
         Returns:
             (`VariableRecord`, optional): the reference of the symbol if found; None if otherwise
         """
-        if name in self.symbol_table:
-            return self.symbol_table[name]
-        if self.parent and not self.parent.block_child:
-            return self.parent.lookup_symbol(name)
-        return None
+        return self.visible_table.get(name)
 
     current: "Scope" = None
 
+    # class name of the current scope, kept in step with `current` so rules can read it directly
+    current_class_name: Optional[str] = None
+
     @staticmethod
     def enter_new_scope(
         share_table_with_child=False,
@@ -110,9 +120,11 @@ class Scope:
             block_child=block_child,
             class_name=class_name,
         )
+        Scope.current_class_name = Scope.current.class_name
 
     @staticmethod
     def exit_scope():
         if not Scope.current:
             return
         Scope.current = Scope.current.parent
+        Scope.current_class_name = Scope.current.class_name if Scope.current else None
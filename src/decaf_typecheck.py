@@ -9,6 +9,10 @@ from decaf_ast import (
 
 
 def type_check(classes: List["ClassRecord"]):
+    # class name => dependency tree node, for every class registered so far
+    # the same few class names are checked over and over, so the membership test goes straight to the dict
+    known_classes = DependencyTree.CLASS_NAME_TO_NODE
+
     for class_rec in classes:
         # register class into dependency tree
         # we can use the tree to figure out if a class name is valid
@@ -17,11 +21,12 @@ def type_check(classes: List["ClassRecord"]):
 
         # for each field, we need to check their type
         # if the type is not primitive, it needs to be a class that we have seen
+        # built-in types are never subclassed, so an exact type check stands in for isinstance
         for field_rec in class_rec.fields:
-            if isinstance(field_rec.type, BuiltInTypeRecord):
+            if type(field_rec.type) is BuiltInTypeRecord:
                 continue
             target_class_name = field_rec.type.type
-            if not DependencyTree.get_class_record(target_class_name):
+            if target_class_name not in known_classes:
                 raise Exception(
                     f"field `{field_rec.name}` uses `{target_class_name}`, but it does not exist when parsing `{class_rec.name}`"
                 )
@@ -30,10 +35,10 @@ def type_check(classes: List["ClassRecord"]):
         for cons_rec in class_rec.constructors:
             # verify each parameter type
             for var_vec in cons_rec.parameters:
-                if isinstance(var_vec.type, BuiltInTypeRecord):
+                if type(var_vec.type) is BuiltInTypeRecord:
                     continue
                 target_class_name = var_vec.type.type
-                if not DependencyTree.get_class_record(target_class_name):
+                if target_class_name not in known_classes:
                     raise Exception(
                         f"constructor argument `{var_vec.name}` uses `{target_class_name}`, but it does not exist when parsing `{class_rec.name}`"
                     )
@@ -47,19 +52,19 @@ def type_check(classes: List["ClassRecord"]):
         for method_rec in class_rec.methods:
             # check the return type first
             return_type = method_rec.return_type
-            if not isinstance(return_type, BuiltInTypeRecord):
+            if type(return_type) is not BuiltInTypeRecord:
                 target_class_name = return_type.type
-                if not DependencyTree.get_class_record(target_class_name):
+                if target_class_name not in known_classes:
                     raise Exception(
                         f"return type for method `{method_rec.name}` uses `{target_class_name}`, but it does not exist when parsing `{class_rec.name}`"
                     )
 
             # check each parameter next
             for var_vec in method_rec.parameters:
-                if isinstance(var_vec.type, BuiltInTypeRecord):
+                if type(var_vec.type) is BuiltInTypeRecord:
                     continue
                 target_class_name = var_vec.type.type
-                if not DependencyTree.get_class_record(target_class_name):
+                if target_class_name not in known_classes:
                     raise Exception(
                         f"argument `{var_vec.name}` for method `{method_rec.name}` uses `{target_class_name}`, but it does not exist when parsing `{class_rec.name}`"
                     )
@@ -1,20 +1,19 @@
-from typing import List, Optional, Union
+from typing import Optional
 
 
 class Counter:
+    __slots__ = ("start", "curr")
+
     def __init__(self, start: int):
         self.start = start
         self.curr = start
 
     def next(self):
         out = self.curr
-        self.curr += 1
+        self.curr = out + 1
         return out
 
     def reset(self, new_start: Optional[int] = None):
         if new_start != None:
             self.start = new_start
         self.curr = self.start
-
-
-NestedStrList = List[Union[str, "NestedStrList"]]
@@ -1,12 +1,12 @@
 from decaf_ast import ClassRecord
-from enum import Enum
 from decaf_scope import Scope
 
 
-class BodyDecl(Enum):
-    FIELD = "F"
-    METHOD = "M"
-    CONSTRUCTOR = "C"
+class BodyDecl:
+    # tags are positions in the tuple of bucket adders used by p_class_decl
+    FIELD = 0
+    METHOD = 1
+    CONSTRUCTOR = 2
 
 
 def p_class_decl(p):
@@ -21,24 +21,18 @@ def p_class_decl(p):
         raise Exception(f"class {name} cannot extend itself")
 
     # order the body declarations into their respective buckets
-    buckets = {key: [] for key in BodyDecl}
+    # each field declaration holds a list of fields, so it is flattened into the field bucket
+    fields, methods, constructors = [], [], []
+    add_to_bucket = (fields.extend, methods.append, constructors.append)
     for key, decl in declarations:
-        buckets[key].append(decl)
-
-    # the field bucket currently contains list of fields
-    # we need to flatten the bucket out so that is a flat list of fields
-    # this is also when we set the containing class attribute
-    fields = []
-    for field_arr in buckets[BodyDecl.FIELD]:
-        for f in field_arr:
-            fields.append(f)
+        add_to_bucket[key](decl)
 
     Scope.exit_scope()
     p[0] = ClassRecord(
         name=name,
         super_class_name=super_class_name,
-        constructors=buckets[BodyDecl.CONSTRUCTOR],
-        methods=buckets[BodyDecl.METHOD],
+        constructors=constructors,
+        methods=methods,
         fields=fields,
     )
 
@@ -68,14 +62,14 @@ def p_optional_extends(p):
 
 def p_at_least_one_class_body_decl(p):
     """
-    at_least_one_class_body_decl : class_body_decl at_least_one_class_body_decl
+    at_least_one_class_body_decl : at_least_one_class_body_decl class_body_decl
                                  | class_body_decl
     """
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[2].insert(0, p[1])
-        p[0] = p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 # def p_class_body_decl(p):
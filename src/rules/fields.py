@@ -1,5 +1,9 @@
 from typing import List
 from decaf_ast import (
+    INSTANCE,
+    PRIVATE,
+    PUBLIC,
+    STATIC,
     BuiltInTypeRecordCollection,
     FieldRecord,
     UserTypeRecord,
@@ -12,10 +16,10 @@ def p_field_decl(p):
     """
     field_decl : modifier var_decl
     """
-    modifier = p[1]
+    visibility, is_static = p[1]
     variable_records: List["VariableRecord"] = p[2]
 
-    scope_class_name = Scope.current.class_name
+    scope_class_name = Scope.current_class_name
 
     # this is removed it will be checked during ClassRecord construction
     # for v in variable_records:
@@ -25,8 +29,8 @@ def p_field_decl(p):
 
     p[0] = [
         FieldRecord(
-            visibility=modifier["visibility"],
-            applicability="static" if modifier["is_static"] else "instance",
+            visibility=visibility,
+            applicability=STATIC if is_static else INSTANCE,
             type=v.type,
             name=v.name,
             containing_class=scope_class_name,
@@ -40,7 +44,8 @@ def p_modifier(p):
     """
     modifier : optional_public_or_private optional_static
     """
-    p[0] = {"visibility": p[1], "is_static": p[2]}
+    # (visibility, is_static)
+    p[0] = (p[1], p[2])
 
 
 def p_optional_public_or_private(p):
@@ -49,10 +54,8 @@ def p_optional_public_or_private(p):
                                | PRIVATE
                                | empty
     """
-    if p[1] == None:
-        p[0] = "private"  # by default
-    else:
-        p[0] = p[1]
+    # the token text is swapped for the shared constant; anything but PUBLIC is private (the default)
+    p[0] = PUBLIC if p[1] == PUBLIC else PRIVATE
 
 
 def p_optional_static(p):
@@ -131,13 +134,13 @@ def p_type_id(p):
 def p_variables(p):
     """
     variables : variable
-              | variable COMMA variables
+              | variables COMMA variable
     """
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[3].insert(0, p[1])
-        p[0] = p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_variable(p):
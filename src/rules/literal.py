@@ -4,6 +4,7 @@ from decaf_ast import (
     StringConstantExpressionRecord,
     NullConstantExpressionRecord,
     BooleanConstantExpressionRecord,
+    line_range,
 )
 
 # def p_literal(p):
@@ -23,32 +24,28 @@ def p_literal_int(p):
     """
     literal : INTEGER_CONSTANT
     """
-    s = t = p.lineno(1)
-    p[0] = IntegerConstantExpressionRecord((s, t), p[1])
+    p[0] = IntegerConstantExpressionRecord(line_range(p.lineno(1)), p[1])
 
 
 def p_literal_float(p):
     """
     literal : FLOAT_CONSTANT
     """
-    s = t = p.lineno(1)
-    p[0] = FloatConstantExpressionRecord((s, t), p[1])
+    p[0] = FloatConstantExpressionRecord(line_range(p.lineno(1)), p[1])
 
 
 def p_literal_string(p):
     """
     literal : STRING
     """
-    s = t = p.lineno(1)
-    p[0] = StringConstantExpressionRecord((s, t), p[1])
+    p[0] = StringConstantExpressionRecord(line_range(p.lineno(1)), p[1])
 
 
 def p_literal_null(p):
     """
     literal : NULL
     """
-    s = t = p.lineno(1)
-    p[0] = NullConstantExpressionRecord((s, t))
+    p[0] = NullConstantExpressionRecord(line_range(p.lineno(1)))
 
 
 def p_literal_boolean(p):
@@ -56,5 +53,4 @@ def p_literal_boolean(p):
     literal : TRUE
             | FALSE
     """
-    s = t = p.lineno(1)
-    p[0] = BooleanConstantExpressionRecord((s, t), p[1])
+    p[0] = BooleanConstantExpressionRecord(line_range(p.lineno(1)), p[1])
@@ -1,4 +1,4 @@
-from decaf_ast import MethodRecord, ConstructorRecord, VariableRecord
+from decaf_ast import INSTANCE, STATIC, MethodRecord, ConstructorRecord, VariableRecord
 from decaf_scope import Scope
 
 
@@ -24,16 +24,16 @@ def p_method_decl(p):
     """
     method_decl : modifier type ID enter_function_scope optional_formals RPAREN block
     """
-    modifier = p[1]
+    visibility, is_static = p[1]
 
-    scope_class_name = Scope.current.class_name
+    scope_class_name = Scope.current_class_name
     variable_table = Scope.current.variable_table
     Scope.exit_scope()
 
     p[0] = MethodRecord(
         name=p[3],
-        visibility=modifier["visibility"],
-        applicability="static" if modifier["is_static"] else "instance",
+        visibility=visibility,
+        applicability=STATIC if is_static else INSTANCE,
         parameters=p[5],
         return_type=p[2],
         body=p[7],
@@ -47,7 +47,7 @@ def p_constructor_decl(p):
     constructor_decl : modifier ID enter_function_scope optional_formals RPAREN block
     """
     constructor_name = p[2]
-    scope_class_name = Scope.current.class_name
+    scope_class_name = Scope.current_class_name
     if constructor_name != scope_class_name:
         raise Exception(f"Expected only constructor for {scope_class_name}, but got {constructor_name}")
 
@@ -55,7 +55,7 @@ def p_constructor_decl(p):
     Scope.exit_scope()
 
     p[0] = ConstructorRecord(
-        visibility=p[1]["visibility"],
+        visibility=p[1][0],
         parameters=p[4],
         body=p[6],
         containing_class=scope_class_name,
@@ -76,14 +76,14 @@ def p_optional_formals(p):
 
 def p_formals(p):
     """
-    formals : formal_param COMMA formals
+    formals : formals COMMA formal_param
             | formal_param
     """
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[3].insert(0, p[1])
-        p[0] = p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_formal_param(p):
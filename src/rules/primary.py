@@ -6,6 +6,7 @@ from decaf_ast import (
     SuperExpressionRecord,
     ThisExpressionRecord,
     VarExpressionRecord,
+    line_range,
 )
 from decaf_scope import Scope
 
@@ -31,7 +32,7 @@ def p_primary_new_object(p):
     """
     primary : NEW ID LPAREN optional_arguments RPAREN
     """
-    class_name = Scope.current.class_name
+    class_name = Scope.current_class_name
     s = p.lineno(1)
     t = p.lineno(5)
     p[0] = NewObjectExpressionRecord((s, t), p[2], p[4], class_name)
@@ -41,20 +42,18 @@ def p_primary_this(p):
     """
     primary : THIS
     """
-    containing_class = Scope.current.class_name
+    containing_class = Scope.current_class_name
 
-    s = t = p.lineno(1)
-    p[0] = ThisExpressionRecord((s, t), containing_class)
+    p[0] = ThisExpressionRecord(line_range(p.lineno(1)), containing_class)
 
 
 def p_primary_super(p):
     """
     primary : SUPER
     """
-    containing_class = Scope.current.class_name
+    containing_class = Scope.current_class_name
 
-    s = t = p.lineno(1)
-    p[0] = SuperExpressionRecord((s, t), containing_class)
+    p[0] = SuperExpressionRecord(line_range(p.lineno(1)), containing_class)
 
 
 def p_optional_arguments(p):
@@ -73,14 +72,14 @@ def p_optional_arguments(p):
 
 def p_arguments(p):
     """
-    arguments : expr COMMA arguments
+    arguments : arguments COMMA expr
               | expr
     """
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[3].insert(0, p[1])
-        p[0] = p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_lhs(p):
@@ -104,13 +103,11 @@ def p_field_access(p):
             # since the symbol doesnt exist in this scope or any preceding scope
             # this symbol is either missing or a class reference
             # we will assume it is a class reference and then perform another check during type checking
-            l = p.lineno(1)
-            p[0] = ClassReferenceExpressionRecord((l, l), name)
+            p[0] = ClassReferenceExpressionRecord(line_range(p.lineno(1)), name)
         else:
-            s = t = p.lineno(1)
-            p[0] = VarExpressionRecord((s, t), rec)
+            p[0] = VarExpressionRecord(line_range(p.lineno(1)), rec)
     else:
-        class_name = Scope.current.class_name
+        class_name = Scope.current_class_name
         s = p.lineno(1)
         t = p.lineno(3)
         p[0] = FieldAccessExpressionRecord((s, t), p[1], p[3], class_name)
@@ -129,7 +126,7 @@ def p_method_invocation(p):
             f"method invocations not allowed with implicit object/class reference at line {s}"
         )
 
-    class_name = Scope.current.class_name
+    class_name = Scope.current_class_name
     t = p.lineno(4)
     p[0] = MethodCallExpressionRecord(
         (s, t), field_access.base, field_access.name, p[3], class_name
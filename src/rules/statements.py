@@ -11,6 +11,7 @@ from decaf_ast import (
     BreakStatementRecord,
     ContinueStatementRecord,
     SkipStatementRecord,
+    line_range,
 )
 from decaf_scope import Scope
 
@@ -34,18 +35,18 @@ def p_block(p):
 
 def p_stmt_list(p):
     """
-    stmt_list : stmt stmt_list
+    stmt_list : stmt_list stmt
               | empty
     """
     if len(p) == 2:
         p[0] = []
     else:
-        stmt = p[1]
+        stmt = p[2]
         # we need to include this inside the AST, but not during prinint
         # if not isinstance(stmt, VariableDeclarationStatementRecord):
-        #     p[2].insert(0, stmt)
-        p[2].insert(0, stmt)
-        p[0] = p[2]
+        #     p[1].append(stmt)
+        p[1].append(stmt)
+        p[0] = p[1]
 
 
 # def p_stmt(p):
@@ -75,16 +76,14 @@ def p_stmt_var_decl(p):
         if not Scope.current.add_symbol(v):
             raise Exception(f"Duplicate variable name in scope: {v.name} at line {l}")
 
-    s = t = l
-    p[0] = VariableDeclarationStatementRecord((s, t), variables)
+    p[0] = VariableDeclarationStatementRecord(line_range(l), variables)
 
 
 def p_skip_stmt(p):
     """
     stmt : SEMICOLON
     """
-    s = t = p.lineno(1)
-    p[0] = SkipStatementRecord((s, t))
+    p[0] = SkipStatementRecord(line_range(p.lineno(1)))
 
 
 def p_block_stmt(p):